@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Application service for inventory operations (listing vaults and recovery points)."""
 
+import dataclasses
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Protocol
 
 from aws_vault_shuffle.domain.config import RegionConfig
-from aws_vault_shuffle.domain.vault import Vault
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
 
 __version__ = "0.1.0"
 
@@ -16,7 +21,7 @@ def file_info() -> dict[str, str]:
         "description": "Application service for listing vaults and recovery points",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
@@ -26,13 +31,14 @@ class BackupClient(Protocol):
 
     This keeps the application layer independent of AWS SDK implementation.
     Infrastructure layer will provide concrete implementations.
+    Implementations must be safe to call from multiple threads.
     """
 
     def list_vaults(self, region: str) -> list[Vault]:
         """List all backup vaults in a region."""
         ...
 
-    def list_recovery_points(self, vault_name: str, region: str) -> list[Vault]:
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
         """List all recovery points for a vault in a region."""
         ...
 
@@ -59,20 +65,66 @@ class InventoryService:
         Returns:
             List of Vault objects with their recovery points
         """
-        all_vaults: list[Vault] = []
+        return list(self.iter_all_vaults(config))
 
-        for region in config.regions:
-            # Get vaults in this region
-            vaults = self.backup_client.list_vaults(region)
+    def iter_all_vaults(self, config: RegionConfig) -> Iterator[Vault]:
+        """
+        Yield vaults with their recovery points as soon as each is fetched.
+
+        Regions and vaults share one worker pool, and no more than
+        ``config.max_workers`` AWS calls are ever in flight at once.
+        The AWS calls are network-bound, so threads overlap the request latency.
+
+        Every region's vault list is requested up front. Recovery point
+        listings run at most ``2 * config.max_workers`` vaults ahead of the
+        caller, and each vault is released once yielded, so memory stays
+        proportional to that window rather than to the whole inventory.
+
+        Args:
+            config: Region configuration specifying account and regions to scan
 
-            # For each vault, get its recovery points
-            for vault in vaults:
-                vault_with_points = self.backup_client.list_recovery_points(
-                    vault.name, region
+        Yields:
+            Vault objects with their recovery points, in configured region order
+        """
+        pool = ThreadPoolExecutor(max_workers=config.max_workers)
+        finished = False
+        try:
+            # Interned so every Vault in a region shares one region string
+            region_listings: deque[tuple[str, Future[list[Vault]]]] = deque()
+            for region in map(sys.intern, config.regions):
+                region_listings.append(
+                    (region, pool.submit(self.backup_client.list_vaults, region))
                 )
-                all_vaults.extend(vault_with_points)
 
-        return all_vaults
+            max_pending = 2 * config.max_workers
+            pending: deque[Future[Vault]] = deque()
+            region = ""
+            vaults: Iterator[Vault] = iter(())
+            while True:
+                while len(pending) < max_pending:
+                    vault = next(vaults, None)
+                    if vault is not None:
+                        pending.append(pool.submit(self._with_recovery_points, vault, region))
+                        continue
+                    # Only wait on the next region when nothing is ready to yield
+                    if not region_listings or (pending and not region_listings[0][1].done()):
+                        break
+                    region, listing = region_listings.popleft()
+                    vaults = iter(listing.result())
+
+                if not pending:
+                    break
+                yield pending.popleft().result()
+            finished = True
+        finally:
+            # On error, early exit or Ctrl-C, drop the queued listings instead
+            # of waiting for every remaining AWS call to run
+            pool.shutdown(wait=finished, cancel_futures=not finished)
+
+    def _with_recovery_points(self, vault: Vault, region: str) -> Vault:
+        """Return a copy of the vault with its recovery points populated."""
+        recovery_points = self.backup_client.list_recovery_points(vault.name, region)
+        return dataclasses.replace(vault, recovery_points=recovery_points)
 
 
 def main() -> None:
@@ -89,16 +141,9 @@ def main() -> None:
                 )
             ]
 
-        def list_recovery_points(self, vault_name: str, region: str) -> list[Vault]:
-            # Return vault with empty recovery points for demo
-            return [
-                Vault(
-                    name=vault_name,
-                    arn=f"arn:aws:backup:{region}:123456789012:backup-vault:{vault_name}",
-                    region=region,
-                    recovery_points=(),
-                )
-            ]
+        def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
+            # Return empty recovery points for demo
+            return ()
 
     # Create service with fake client
     service = InventoryService(FakeBackupClient())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Application module for pacing AWS Backup API calls with a token bucket."""
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+__version__ = "0.1.0"
+
+
+def file_info() -> dict[str, str]:
+    """Return file metadata."""
+    return {
+        "name": "rate_limiter",
+        "description": "Token bucket rate limiting for AWS Backup API calls",
+        "version": __version__,
+        "author": "John Ayers",
+        "last_updated": "2026-10-15",
+    }
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing ``rate`` calls per second on average.
+
+    Up to ``burst`` calls may go through back to back; after that callers
+    block until tokens refill. Use as a context manager around each call.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (default: one second's worth of tokens)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got: {rate}")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            # Sleep outside the lock so other threads can check the bucket
+            self._sleep(wait)
+
+    def __enter__(self) -> "TokenBucket":
+        """Acquire a token on entry."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Nothing to release; tokens refill over time."""
+
+
+def main() -> None:
+    """Demonstrate token bucket pacing (for testing)."""
+    bucket = TokenBucket(rate=5, burst=2)
+    start = time.monotonic()
+    for i in range(6):
+        with bucket:
+            print(f"call {i} at {time.monotonic() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,13 @@
 """Command-line interface for aws-vault-shuffle."""
 
 import argparse
+import functools
 import sys
-from typing import Optional
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Callable, Optional
 
 from aws_vault_shuffle.__version__ import __version__
-from aws_vault_shuffle.application.inventory_service import InventoryService
-from aws_vault_shuffle.infrastructure.aws_backup_adapter import AWSBackupAdapter
-from aws_vault_shuffle.infrastructure.config_loader import load_from_cli, load_from_yaml
-
-__version__ = "0.1.0"
 
 
 def file_info() -> dict[str, str]:
@@ -20,12 +18,18 @@ def file_info() -> dict[str, str]:
         "description": "Command-line interface entry point",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+    """
+    Create and configure the argument parser.
+
+    The parser is built once and shared; parse_args() does not modify it,
+    but callers must not add arguments or change defaults on the result.
+    """
     parser = argparse.ArgumentParser(
         prog="aws-vault-shuffle",
         description="CLI tool to copy AWS Backup recovery points between AWS accounts at scale",
@@ -79,12 +83,95 @@ def create_parser() -> argparse.ArgumentParser:
         default="table",
         help="Output format (default: table)",
     )
+    list_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Maximum concurrent AWS Backup API calls (default: 20, or max_workers from --config)",
+    )
+    list_parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=0,
+        metavar="SECONDS",
+        help="Reuse cached AWS listings younger than SECONDS (default: 0, disabled)",
+    )
+    list_parser.add_argument(
+        "--max-tps",
+        type=float,
+        default=10.0,
+        help="Maximum AWS Backup API calls per second (default: 10, 0 disables)",
+    )
 
     return parser
 
 
+# `list` options the fast path understands: flag -> (destination, argparse type)
+_LIST_OPTIONS: dict[str, tuple[str, Callable[[str], object]]] = {
+    "--account": ("account", str),
+    "--regions": ("regions", str),
+    "--config": ("config", str),
+    "--output": ("output", str),
+    "--max-workers": ("max_workers", int),
+    "--cache-ttl": ("cache_ttl", int),
+    "--max-tps": ("max_tps", float),
+}
+_OUTPUT_CHOICES = ("json", "table", "summary")
+
+
+def _fast_parse_list(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse a plain `list --flag value ...` command line without argparse.
+
+    Only handles the common shape; anything else (help, abbreviations,
+    --flag=value, bad values) returns None so argparse can parse it and
+    report errors exactly as before.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Namespace equal to create_parser().parse_args(argv), or None
+    """
+    if not argv or argv[0] != "list" or len(argv) % 2 == 0:
+        return None
+
+    args = argparse.Namespace(
+        dry_run=False,
+        log_level="INFO",
+        command="list",
+        account=None,
+        regions=None,
+        config=None,
+        output="table",
+        max_workers=None,
+        cache_ttl=0,
+        max_tps=10.0,
+    )
+    for flag, value in zip(argv[1::2], argv[2::2]):
+        option = _LIST_OPTIONS.get(flag)
+        if option is None or value.startswith("-"):
+            return None
+        dest, convert = option
+        try:
+            setattr(args, dest, convert(value))
+        except ValueError:
+            return None
+
+    if args.output not in _OUTPUT_CHOICES:
+        return None
+    return args
+
+
 def handle_list(args: argparse.Namespace) -> int:
     """Handle the 'list' command."""
+    # Imported here so --help and --version never pay for boto3 and PyYAML
+    from aws_vault_shuffle.application.inventory_service import BackupClient, InventoryService
+    from aws_vault_shuffle.application.rate_limiter import TokenBucket
+    from aws_vault_shuffle.infrastructure.aws_backup_adapter import AWSBackupAdapter
+    from aws_vault_shuffle.infrastructure.config_loader import load_from_cli, load_from_yaml
+    from aws_vault_shuffle.infrastructure.response_cache import CachedBackupClient
+
     try:
         # Load configuration
         if args.config:
@@ -97,10 +184,11 @@ def handle_list(args: argparse.Namespace) -> int:
             if not args.regions:
                 print("ERROR: --regions is required when not using --config", file=sys.stderr)
                 return 1
-            config = load_from_cli(
-                account=args.account,
-                regions=args.regions,
-            )
+            config = load_from_cli(account=args.account, regions=args.regions)
+
+        # An explicit --max-workers overrides the config file and the default
+        if args.max_workers is not None:
+            config = replace(config, max_workers=args.max_workers)
 
         # Display configuration
         print(f"Account: {config.source_account}")
@@ -108,18 +196,29 @@ def handle_list(args: argparse.Namespace) -> int:
         print(f"Scanning {config.region_count()} region(s)...")
         print()
 
-        # Create AWS Backup adapter
-        adapter = AWSBackupAdapter(
+        # Create AWS Backup adapter, pacing every API request to stay under
+        # the account's API quotas
+        adapter: BackupClient = AWSBackupAdapter(
             assume_role_arn=config.assume_role_arn,
             external_id=config.external_id,
             session_name=config.session_name,
+            before_request=TokenBucket(rate=args.max_tps).acquire if args.max_tps > 0 else None,
+            max_workers=config.max_workers,
         )
 
+        # Reuse recent listings from the disk cache if requested
+        if args.cache_ttl > 0:
+            adapter = CachedBackupClient(
+                adapter,
+                account=config.source_account,
+                ttl_seconds=args.cache_ttl,
+            )
+
         # Create inventory service
         inventory_service = InventoryService(adapter)
 
-        # List all vaults and recovery points
-        vaults = inventory_service.list_all_vaults(config)
+        # Stream vaults and recovery points as they are fetched
+        vaults = inventory_service.iter_all_vaults(config)
 
         # Format output
         if args.output == "json":
@@ -146,35 +245,47 @@ def handle_list(args: argparse.Namespace) -> int:
 
 
 def _print_table_output(vaults) -> None:
-    """Print vaults and recovery points in table format."""
-    if not vaults:
-        print("No backup vaults found.")
-        return
-
-    total_vaults = len(vaults)
-    total_recovery_points = sum(v.recovery_point_count() for v in vaults)
-    total_size = sum(v.total_backup_size_bytes() for v in vaults)
-
-    print(f"Found {total_vaults} vault(s) with {total_recovery_points} recovery point(s)")
-    print(f"Total backup size: {_format_bytes(total_size)}")
-    print()
+    """Print vaults and recovery points in table format as they arrive."""
+    total_vaults = 0
+    total_recovery_points = 0
+    total_size = 0
 
     for vault in vaults:
-        print(f"Vault: {vault.name} ({vault.region})")
-        print(f"  ARN: {vault.arn}")
-        print(f"  Recovery Points: {vault.recovery_point_count()}")
+        rp_count = vault.recovery_point_count()
+        total_vaults += 1
+        total_recovery_points += rp_count
+        total_size += vault.total_backup_size_bytes()
+
+        # Build the whole vault block and emit it with a single write
+        parts = [
+            f"Vault: {vault.name} ({vault.region})\n",
+            f"  ARN: {vault.arn}\n",
+            f"  Recovery Points: {rp_count}\n",
+        ]
 
         if vault.recovery_points:
-            print(f"  Recovery Points:")
+            parts.append("  Recovery Points:\n")
             for rp in vault.recovery_points:
-                size_str = _format_bytes(rp.backup_size_bytes) if rp.backup_size_bytes else "unknown"
-                print(f"    - {rp.resource_type}: {rp.resource_arn}")
-                print(f"      Status: {rp.status}, Size: {size_str}, Created: {rp.creation_date}")
-        print()
+                size_str = (
+                    _format_bytes(rp.backup_size_bytes) if rp.backup_size_bytes else "unknown"
+                )
+                parts.append(f"    - {rp.resource_type}: {rp.resource_arn}\n")
+                parts.append(
+                    f"      Status: {rp.status}, Size: {size_str}, Created: {rp.creation_date}\n"
+                )
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
+
+    if not total_vaults:
+        print("No backup vaults found.")
+        return
+
+    print(f"Found {total_vaults} vault(s) with {total_recovery_points} recovery point(s)")
+    print(f"Total backup size: {_format_bytes(total_size)}")
 
 
 def _print_json_output(vaults) -> None:
-    """Print vaults and recovery points in JSON format."""
+    """Print vaults and recovery points as a JSON array, one vault at a time."""
     import json
     from datetime import datetime
 
@@ -184,7 +295,26 @@ def _print_json_output(vaults) -> None:
             return obj.isoformat()
         raise TypeError(f"Type {type(obj)} not serializable")
 
-    vault_data = []
+    def encode_stdlib(obj: dict) -> str:
+        # ensure_ascii=False writes non-ASCII text as is, the way orjson does
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=json_serializer)
+
+    try:
+        import orjson  # Optional C encoder: pip install aws-vault-shuffle[fast]
+    except ImportError:
+        encode = encode_stdlib
+    else:
+
+        def encode(obj: dict) -> str:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+            except orjson.JSONEncodeError:
+                # orjson rejects integers wider than 64 bits; json writes them
+                return encode_stdlib(obj)
+
+    # Emit the same text as json.dumps(list, indent=2, ensure_ascii=False)
+    # without holding the list
+    separator = "[\n  "
     for vault in vaults:
         vault_dict = {
             "name": vault.name,
@@ -205,37 +335,49 @@ def _print_json_output(vaults) -> None:
                 for rp in vault.recovery_points
             ],
         }
-        vault_data.append(vault_dict)
+        sys.stdout.write(separator + encode(vault_dict).replace("\n", "\n  "))
+        separator = ",\n  "
+
+    print("[]" if separator == "[\n  " else "\n]")
+
 
-    print(json.dumps(vault_data, indent=2, default=json_serializer))
+@dataclass(slots=True)
+class _RegionStats:
+    """Running per-region totals for summary output."""
+
+    vaults: int = 0
+    recovery_points: int = 0
+    size_bytes: int = 0
 
 
 def _print_summary_output(vaults) -> None:
     """Print summary of vaults and recovery points."""
-    if not vaults:
-        print("No backup vaults found.")
-        return
+    total_vaults = 0
+    total_recovery_points = 0
+    total_size = 0
+    by_region: defaultdict[str, _RegionStats] = defaultdict(_RegionStats)
+    by_type: defaultdict[str, int] = defaultdict(int)
 
-    total_vaults = len(vaults)
-    total_recovery_points = sum(v.recovery_point_count() for v in vaults)
-    total_size = sum(v.total_backup_size_bytes() for v in vaults)
-
-    # Count by region
-    by_region = {}
-    for vault in vaults:
-        if vault.region not in by_region:
-            by_region[vault.region] = {"vaults": 0, "recovery_points": 0, "size_bytes": 0}
-        by_region[vault.region]["vaults"] += 1
-        by_region[vault.region]["recovery_points"] += vault.recovery_point_count()
-        by_region[vault.region]["size_bytes"] += vault.total_backup_size_bytes()
-
-    # Count by resource type
-    by_type = {}
     for vault in vaults:
-        for rp in vault.recovery_points:
-            if rp.resource_type not in by_type:
-                by_type[rp.resource_type] = 0
-            by_type[rp.resource_type] += 1
+        rp_count = vault.recovery_point_count()
+        size = vault.total_backup_size_bytes()
+        total_vaults += 1
+        total_recovery_points += rp_count
+        total_size += size
+
+        # Count by region
+        region_stats = by_region[vault.region]
+        region_stats.vaults += 1
+        region_stats.recovery_points += rp_count
+        region_stats.size_bytes += size
+
+        # Count by resource type
+        for resource_type, count in vault.resource_type_counts().items():
+            by_type[resource_type] += count
+
+    if not total_vaults:
+        print("No backup vaults found.")
+        return
 
     print("=== Summary ===")
     print(f"Total Vaults: {total_vaults}")
@@ -245,7 +387,9 @@ def _print_summary_output(vaults) -> None:
 
     print("By Region:")
     for region, stats in sorted(by_region.items()):
-        print(f"  {region}: {stats['vaults']} vault(s), {stats['recovery_points']} recovery point(s), {_format_bytes(stats['size_bytes'])}")
+        print(
+            f"  {region}: {stats.vaults} vault(s), {stats.recovery_points} recovery point(s), {_format_bytes(stats.size_bytes)}"
+        )
     print()
 
     if by_type:
@@ -254,20 +398,34 @@ def _print_summary_output(vaults) -> None:
             print(f"  {resource_type}: {count}")
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _format_bytes(num_bytes: Optional[int]) -> str:
     """Format bytes into human-readable string."""
     if num_bytes is None:
         return "unknown"
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if num_bytes < 1024.0:
-            return f"{num_bytes:.2f} {unit}"
-        num_bytes /= 1024.0
-    return f"{num_bytes:.2f} PB"
+    # Each unit is 2**10 larger, so the bit length picks the unit directly
+    idx = max(0, min(5, (num_bytes.bit_length() - 1) // 10))
+    return f"{num_bytes / (1 << (idx * 10)):.2f} {_BYTE_UNITS[idx]}"
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: answer a bare --version without building the parser
+    if argv == ["--version"]:
+        print(f"aws-vault-shuffle {__version__}")
+        return 0
+
+    # Fast path: the everyday `list --flag value ...` form skips argparse
+    args = _fast_parse_list(argv)
+    if args is not None:
+        return handle_list(args)
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
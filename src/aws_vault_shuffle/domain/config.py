@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Domain models for configuration."""
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
 __version__ = "0.1.0"
 
+# Region names like us-east-1, us-gov-west-1 or eusc-de-east-1
+_REGION_RE = re.compile(r"\A[a-z]{2,}(?:-[a-z]+)+-[0-9]+\Z")
+
 
 def file_info() -> dict[str, str]:
     """Return file metadata."""
@@ -14,11 +18,11 @@ def file_info() -> dict[str, str]:
         "description": "Domain models for configuration",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegionConfig:
     """
     Configuration for AWS regions to scan.
@@ -32,23 +36,11 @@ class RegionConfig:
     assume_role_arn: Optional[str] = None
     external_id: Optional[str] = None
     session_name: str = "aws-vault-shuffle"
+    max_workers: int = 20
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        # Validate account number format (12 digits)
-        if not self.source_account.isdigit() or len(self.source_account) != 12:
-            raise ValueError(
-                f"source_account must be a 12-digit number, got: {self.source_account}"
-            )
-
-        # Validate at least one region
-        if not self.regions:
-            raise ValueError("At least one region must be specified")
-
-        # Validate region format (basic check)
-        for region in self.regions:
-            if not region or "-" not in region:
-                raise ValueError(f"Invalid region format: {region}")
+        _validate_region_config(self.source_account, self.regions, self.max_workers)
 
     def region_count(self) -> int:
         """Return the number of regions configured."""
@@ -59,6 +51,34 @@ class RegionConfig:
         return self.assume_role_arn is not None
 
 
+def _validate_region_config(
+    source_account: str, regions: tuple[str, ...], max_workers: int
+) -> None:
+    """
+    Validate RegionConfig fields, stopping at the first problem.
+
+    Raises:
+        ValueError: If any field is invalid
+    """
+    # Validate account number format (12 ASCII digits; isdigit alone
+    # would also accept other Unicode digits)
+    if not (len(source_account) == 12 and source_account.isascii() and source_account.isdigit()):
+        raise ValueError(f"source_account must be a 12-digit number, got: {source_account}")
+
+    # Validate at least one region
+    if not regions:
+        raise ValueError("At least one region must be specified")
+
+    # Validate region format; only rescan to name the culprit on failure
+    if not all(map(_REGION_RE.match, regions)):
+        invalid = next(r for r in regions if not _REGION_RE.match(r))
+        raise ValueError(f"Invalid region format: {invalid}")
+
+    # Validate concurrency limit
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got: {max_workers}")
+
+
 def main() -> None:
     """Demonstrate domain model usage (for testing)."""
     # Example valid config
@@ -75,7 +95,7 @@ def main() -> None:
 
     # Example invalid config (will raise ValueError)
     try:
-        invalid = RegionConfig(
+        RegionConfig(
             source_account="invalid",
             regions=("us-east-1",),
         )
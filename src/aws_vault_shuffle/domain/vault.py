@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 """Domain models for AWS Backup vaults and recovery points."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Optional
 
 __version__ = "0.1.0"
 
+_SECONDS_PER_DAY = 86400
+
+# Epoch seconds used by age_days() when no reference date is passed; a
+# ContextVar so a pin in one thread or task never leaks into another
+_REFERENCE_NOW: ContextVar[Optional[float]] = ContextVar("_REFERENCE_NOW", default=None)
+
 
 def file_info() -> dict[str, str]:
     """Return file metadata."""
@@ -15,12 +27,51 @@ def file_info() -> dict[str, str]:
         "description": "Domain models for Vault and RecoveryPoint",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
-@dataclass(frozen=True)
-class RecoveryPoint:
+@contextmanager
+def freeze_reference_time(reference_date: Optional[datetime] = None) -> Iterator[None]:
+    """
+    Pin the default reference time of RecoveryPoint.age_days() for a batch.
+
+    Ages computed inside the block share one clock reading instead of each
+    querying the current time, so a scan over many recovery points is both
+    cheaper and consistent.
+
+    Args:
+        reference_date: Time to pin (default: the current time)
+    """
+    token = _REFERENCE_NOW.set(reference_date.timestamp() if reference_date else time.time())
+    try:
+        yield
+    finally:
+        _REFERENCE_NOW.reset(token)
+
+
+def _reference_ts(reference_date: Optional[datetime]) -> float:
+    """Resolve the epoch seconds ages are measured against."""
+    if reference_date is not None:
+        return reference_date.timestamp()
+    pinned = _REFERENCE_NOW.get()
+    return pinned if pinned is not None else time.time()
+
+
+def _reduce_by_init(obj: Any) -> tuple[type, tuple[object, ...]]:
+    """Copy and pickle through __init__ so derived slots are recomputed."""
+    return (type(obj), tuple(getattr(obj, f.name) for f in fields(obj)))
+
+
+class _RecoveryPointSlots:
+    """Derived RecoveryPoint state, kept out of dataclass fields()."""
+
+    __slots__ = ("_creation_ts",)
+    _creation_ts: Optional[float]
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class RecoveryPoint(_RecoveryPointSlots):
     """
     Represents an AWS Backup recovery point (snapshot/backup).
 
@@ -37,6 +88,19 @@ class RecoveryPoint:
     backup_size_bytes: Optional[int] = None
     completion_date: Optional[datetime] = None
 
+    __reduce__ = _reduce_by_init
+
+    def __post_init__(self) -> None:
+        """Intern low-cardinality strings and precompute a fixed-offset creation epoch."""
+        object.__setattr__(self, "vault_name", sys.intern(self.vault_name))
+        object.__setattr__(self, "resource_type", sys.intern(self.resource_type))
+        object.__setattr__(self, "status", sys.intern(self.status))
+        # Only fixed offsets make elapsed seconds equal timedelta days; naive
+        # and DST-observing zones keep timedelta arithmetic, see _age_days()
+        tzinfo = self.creation_date.tzinfo
+        creation_ts = self.creation_date.timestamp() if isinstance(tzinfo, timezone) else None
+        object.__setattr__(self, "_creation_ts", creation_ts)
+
     def is_completed(self) -> bool:
         """Check if the recovery point has completed."""
         return self.status == "COMPLETED"
@@ -47,13 +111,35 @@ class RecoveryPoint:
 
     def age_days(self, reference_date: Optional[datetime] = None) -> int:
         """Calculate age in days from creation date."""
-        ref = reference_date or datetime.now(self.creation_date.tzinfo)
-        delta = ref - self.creation_date
-        return delta.days
+        return self._age_days(reference_date, _reference_ts(reference_date))
+
+    def _age_days(self, reference_date: Optional[datetime], ref_ts: float) -> int:
+        """Calculate age in days against an already resolved reference epoch."""
+        if self._creation_ts is not None and (
+            reference_date is None or reference_date.tzinfo is not None
+        ):
+            return int((ref_ts - self._creation_ts) // _SECONDS_PER_DAY)
 
+        # Naive datetimes, and aware ones sharing a tzinfo, count wall-clock
+        # days across DST changes, and mixing naive with aware raises, exactly
+        # as timedelta.days does; the default reference is "now" in the
+        # creation date's own zone
+        if reference_date is None:
+            reference_date = datetime.fromtimestamp(ref_ts, self.creation_date.tzinfo)
+        return (reference_date - self.creation_date).days
 
-@dataclass(frozen=True)
-class Vault:
+
+class _VaultSlots:
+    """Aggregates derived from a Vault's recovery points, kept out of dataclass fields()."""
+
+    __slots__ = ("_total_size", "_completed", "_type_counts")
+    _total_size: int
+    _completed: tuple[RecoveryPoint, ...]
+    _type_counts: dict[str, int]
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Vault(_VaultSlots):
     """
     Represents an AWS Backup vault.
 
@@ -66,21 +152,58 @@ class Vault:
     region: str
     recovery_points: tuple[RecoveryPoint, ...] = ()
 
+    __reduce__ = _reduce_by_init
+
+    def __post_init__(self) -> None:
+        """Precompute recovery point aggregates in a single pass."""
+        total_size = 0
+        completed = []
+        type_counts: dict[str, int] = {}
+        for rp in self.recovery_points:
+            if rp.backup_size_bytes is not None:
+                total_size += rp.backup_size_bytes
+            if rp.is_completed():
+                completed.append(rp)
+            type_counts[rp.resource_type] = type_counts.get(rp.resource_type, 0) + 1
+
+        # Frozen dataclass: bypass __setattr__ for derived fields
+        object.__setattr__(self, "_total_size", total_size)
+        object.__setattr__(self, "_completed", tuple(completed))
+        object.__setattr__(self, "_type_counts", type_counts)
+
     def recovery_point_count(self) -> int:
         """Return the number of recovery points in this vault."""
         return len(self.recovery_points)
 
     def completed_recovery_points(self) -> tuple[RecoveryPoint, ...]:
         """Return only completed recovery points."""
-        return tuple(rp for rp in self.recovery_points if rp.is_completed())
+        return self._completed
 
     def total_backup_size_bytes(self) -> int:
-        """Calculate total size of all recovery points with known sizes."""
-        return sum(
-            rp.backup_size_bytes
-            for rp in self.recovery_points
-            if rp.backup_size_bytes is not None
-        )
+        """Return total size of all recovery points with known sizes."""
+        return self._total_size
+
+    def resource_type_counts(self) -> Mapping[str, int]:
+        """Return a read-only count of recovery points per resource type."""
+        return MappingProxyType(self._type_counts)
+
+    def recovery_point_ages_days(
+        self, reference_date: Optional[datetime] = None
+    ) -> tuple[int, ...]:
+        """
+        Return the age in days of every recovery point, in order.
+
+        Resolves the reference time once for the whole vault, so this is
+        cheaper than calling age_days() per recovery point.
+
+        Args:
+            reference_date: Time to measure from (default: as for age_days)
+
+        Returns:
+            Ages matching recovery_points index for index
+        """
+        ref_ts = _reference_ts(reference_date)
+        return tuple(rp._age_days(reference_date, ref_ts) for rp in self.recovery_points)
 
 
 def main() -> None:
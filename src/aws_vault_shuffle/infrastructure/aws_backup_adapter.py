@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 """Infrastructure module for AWS Backup SDK operations."""
 
-from datetime import datetime
-from typing import Any, Optional
-
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+import threading
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 
+# boto3/botocore are imported where first needed: importing them costs far
+# more than the rest of the CLI, and --help or argument errors never need them
 from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
 
 __version__ = "0.1.0"
 
+# Assumed-role credentials are refreshed once they are this close to expiry
+_CREDENTIAL_REFRESH_MARGIN = timedelta(seconds=60)
+_ASSUME_ROLE_DURATION_SECONDS = 3600
+
+# Largest page the Backup list APIs return; fewer pages means fewer round trips
+_PAGINATION_CONFIG = {"PageSize": 1000}
+
 
 def file_info() -> dict[str, str]:
     """Return file metadata."""
@@ -19,7 +27,7 @@ def file_info() -> dict[str, str]:
         "description": "AWS Backup SDK adapter for cloud operations",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
@@ -36,6 +44,8 @@ class AWSBackupAdapter:
         assume_role_arn: Optional[str] = None,
         external_id: Optional[str] = None,
         session_name: str = "aws-vault-shuffle",
+        before_request: Optional[Callable[[], None]] = None,
+        max_workers: int = 20,
     ):
         """
         Initialize AWS Backup adapter.
@@ -44,51 +54,156 @@ class AWSBackupAdapter:
             assume_role_arn: Optional IAM role ARN to assume
             external_id: Optional external ID for role assumption
             session_name: Session name for role assumption
+            before_request: Optional callable run before every AWS Backup API
+                request, e.g. TokenBucket.acquire to pace requests
+            max_workers: Threads that may call the adapter at once, used to
+                size each client's connection pool
         """
         self.assume_role_arn = assume_role_arn
         self.external_id = external_id
         self.session_name = session_name
-        self._sessions: dict[str, Any] = {}
+        self._before_request = before_request
+        # Region -> (credentials, session); the credentials identify stale sessions
+        self._sessions: dict[str, tuple[Optional[dict[str, Any]], Any]] = {}
+        self._sessions_lock = threading.Lock()
+        self._region_locks: dict[str, threading.Lock] = {}
+        # Region -> (session, client); the session identifies stale clients
+        self._backup_clients: dict[str, tuple[Any, Any]] = {}
+        self._credentials_lock = threading.Lock()
+        self._assumed_credentials: Optional[dict[str, Any]] = None
+        self._sts_client: Optional[Any] = None
+        # Shared by every regional client; the pool has a connection for
+        # every worker thread (never below botocore's default of 10), so
+        # keep-alive connections are reused, and adaptive retries absorb
+        # throttling
+        from botocore.config import Config
+
+        self._client_config = Config(
+            retries={"mode": "adaptive", "max_attempts": 10},
+            max_pool_connections=max(max_workers, 10),
+            tcp_keepalive=True,
+        )
 
     def _get_session(self, region: str) -> Any:
         """
         Get or create a boto3 session for a region.
 
-        Uses cached sessions to avoid repeated role assumptions.
+        Uses cached sessions to avoid repeated role assumptions. Session
+        creation is serialized per region because boto3 sessions are not
+        thread-safe; the clients built from them are. Different regions
+        never wait on each other.
+        """
+        # Lock-free fast path once the region has a session built from the
+        # current credentials
+        cached = self._sessions.get(region)
+        if (
+            cached is not None
+            and cached[0] is self._assumed_credentials
+            and self._credentials_fresh()
+        ):
+            return cached[1]
+
+        import boto3
+
+        with self._region_lock(region):
+            credentials = None
+            if self.assume_role_arn:
+                # Refreshing credentials drops sessions built from the old ones
+                credentials = self._get_assumed_credentials()
+
+            # Re-check: another thread may have built it while we waited. A
+            # thread still holding older credentials may also have stored a
+            # session after a refresh; the identity check rebuilds that one
+            cached = self._sessions.get(region)
+            if cached is not None and cached[0] is credentials:
+                return cached[1]
+
+            if credentials:
+                session = boto3.Session(
+                    aws_access_key_id=credentials["AccessKeyId"],
+                    aws_secret_access_key=credentials["SecretAccessKey"],
+                    aws_session_token=credentials["SessionToken"],
+                    region_name=region,
+                )
+            else:
+                # Use default credentials
+                session = boto3.Session(region_name=region)
+
+            self._sessions[region] = (credentials, session)
+            return session
+
+    def _region_lock(self, region: str) -> threading.Lock:
+        """Return the lock serializing session and client setup for a region."""
+        with self._sessions_lock:
+            return self._region_locks.setdefault(region, threading.Lock())
+
+    def _credentials_fresh(self) -> bool:
+        """Check whether cached sessions may keep using the current credentials."""
+        if not self.assume_role_arn:
+            return True
+        cached = self._assumed_credentials
+        return (
+            cached is not None
+            and cached["Expiration"] - datetime.now(timezone.utc) > _CREDENTIAL_REFRESH_MARGIN
+        )
+
+    def _get_assumed_credentials(self) -> dict[str, Any]:
+        """
+        Return assumed-role credentials, calling STS only when needed.
+
+        Credentials are valid in every region, so one AssumeRole call is
+        shared by all regional sessions until it is close to expiry.
         """
-        if region in self._sessions:
-            return self._sessions[region]
+        with self._credentials_lock:
+            if self._credentials_fresh():
+                assert self._assumed_credentials is not None
+                return self._assumed_credentials
+
+            # Assume role for cross-account access; the STS client is built once
+            # because client creation loads the service model from disk
+            if self._sts_client is None:
+                import boto3
 
-        if self.assume_role_arn:
-            # Assume role for cross-account access
-            sts_client = boto3.client("sts")
+                self._sts_client = boto3.client("sts")
             assume_params = {
                 "RoleArn": self.assume_role_arn,
                 "RoleSessionName": self.session_name,
+                "DurationSeconds": _ASSUME_ROLE_DURATION_SECONDS,
             }
             if self.external_id:
                 assume_params["ExternalId"] = self.external_id
 
-            response = sts_client.assume_role(**assume_params)
-            credentials = response["Credentials"]
-
-            session = boto3.Session(
-                aws_access_key_id=credentials["AccessKeyId"],
-                aws_secret_access_key=credentials["SecretAccessKey"],
-                aws_session_token=credentials["SessionToken"],
-                region_name=region,
-            )
-        else:
-            # Use default credentials
-            session = boto3.Session(region_name=region)
-
-        self._sessions[region] = session
-        return session
+            response = self._sts_client.assume_role(**assume_params)
+            creds: dict[str, Any] = response["Credentials"]
+            self._assumed_credentials = creds
+            self._sessions.clear()
+            return creds
 
     def _get_backup_client(self, region: str) -> Any:
-        """Get AWS Backup client for a region."""
+        """
+        Get AWS Backup client for a region.
+
+        Clients are cached per region and rebuilt only when the region's
+        session was replaced by a credential refresh.
+        """
         session = self._get_session(region)
-        return session.client("backup")
+        cached = self._backup_clients.get(region)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        with self._region_lock(region):
+            cached = self._backup_clients.get(region)
+            if cached is not None and cached[0] is session:
+                return cached[1]
+
+            client = session.client("backup", config=self._client_config)
+            if self._before_request is not None:
+                # Fires once per API request, so every page of a paginated
+                # listing is paced on its own
+                before_request = self._before_request
+                client.meta.events.register("before-call.backup", lambda **kwargs: before_request())
+            self._backup_clients[region] = (session, client)
+            return client
 
     def list_vaults(self, region: str) -> list[Vault]:
         """
@@ -101,33 +216,43 @@ class AWSBackupAdapter:
             List of Vault domain objects (without recovery points)
 
         Raises:
-            ClientError: If AWS API call fails
-            BotoCoreError: If boto3 encounters an error
+            RuntimeError: If the AWS API call fails
         """
+        return list(self.iter_vaults(region))
+
+    def iter_vaults(self, region: str) -> Iterator[Vault]:
+        """
+        Yield backup vaults in a region page by page.
+
+        Args:
+            region: AWS region to query
+
+        Yields:
+            Vault domain objects (without recovery points)
+
+        Raises:
+            RuntimeError: If the AWS API call fails
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
         client = self._get_backup_client(region)
-        vaults: list[Vault] = []
 
         try:
             paginator = client.get_paginator("list_backup_vaults")
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig=_PAGINATION_CONFIG):
                 for vault_data in page.get("BackupVaultList", []):
-                    vault = Vault(
+                    yield Vault(
                         name=vault_data["BackupVaultName"],
                         arn=vault_data["BackupVaultArn"],
                         region=region,
                         recovery_points=(),  # Will be populated separately
                     )
-                    vaults.append(vault)
 
         except (ClientError, BotoCoreError) as e:
             # Re-raise with context
-            raise RuntimeError(
-                f"Failed to list backup vaults in {region}: {e}"
-            ) from e
-
-        return vaults
+            raise RuntimeError(f"Failed to list backup vaults in {region}: {e}") from e
 
-    def list_recovery_points(self, vault_name: str, region: str) -> list[Vault]:
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
         """
         List all recovery points for a vault.
 
@@ -136,21 +261,39 @@ class AWSBackupAdapter:
             region: AWS region
 
         Returns:
-            List containing a single Vault object with recovery points populated
+            Tuple of RecoveryPoint domain objects
 
         Raises:
-            ClientError: If AWS API call fails
-            BotoCoreError: If boto3 encounters an error
+            RuntimeError: If the AWS API call fails
         """
+        return tuple(self.iter_recovery_points(vault_name, region))
+
+    def iter_recovery_points(self, vault_name: str, region: str) -> Iterator[RecoveryPoint]:
+        """
+        Yield recovery points for a vault page by page.
+
+        Args:
+            vault_name: Name of the backup vault
+            region: AWS region
+
+        Yields:
+            RecoveryPoint domain objects
+
+        Raises:
+            RuntimeError: If the AWS API call fails
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
         client = self._get_backup_client(region)
-        recovery_points: list[RecoveryPoint] = []
 
         try:
             paginator = client.get_paginator("list_recovery_points_by_backup_vault")
-            for page in paginator.paginate(BackupVaultName=vault_name):
+            for page in paginator.paginate(
+                BackupVaultName=vault_name, PaginationConfig=_PAGINATION_CONFIG
+            ):
                 for rp_data in page.get("RecoveryPoints", []):
                     # Convert AWS data to domain model
-                    rp = RecoveryPoint(
+                    yield RecoveryPoint(
                         arn=rp_data["RecoveryPointArn"],
                         vault_name=vault_name,
                         resource_arn=rp_data["ResourceArn"],
@@ -160,19 +303,6 @@ class AWSBackupAdapter:
                         backup_size_bytes=rp_data.get("BackupSizeInBytes"),
                         completion_date=rp_data.get("CompletionDate"),
                     )
-                    recovery_points.append(rp)
-
-            # Get vault ARN (need to describe the vault)
-            vault_response = client.describe_backup_vault(BackupVaultName=vault_name)
-
-            vault = Vault(
-                name=vault_name,
-                arn=vault_response["BackupVaultArn"],
-                region=region,
-                recovery_points=tuple(recovery_points),
-            )
-
-            return [vault]
 
         except (ClientError, BotoCoreError) as e:
             raise RuntimeError(
@@ -1,15 +1,24 @@
 #!/usr/bin/env python3
 """Infrastructure module for loading configuration from YAML files or CLI arguments."""
 
+import functools
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import Any, Optional
 
 from aws_vault_shuffle.domain.config import RegionConfig
+from aws_vault_shuffle.infrastructure.response_cache import default_cache_dir
 
 __version__ = "0.1.0"
 
+# Read size once fstat() stops describing the remaining data (pipes, growing files)
+_READ_CHUNK = 65536
+
 
 def file_info() -> dict[str, str]:
     """Return file metadata."""
@@ -18,10 +27,23 @@ def file_info() -> dict[str, str]:
         "description": "Configuration loading from YAML files and CLI arguments",
         "version": __version__,
         "author": "John Ayers",
-        "last_updated": "2025-12-04",
+        "last_updated": "2026-10-15",
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> type:
+    """
+    Import PyYAML on first use and pick its fastest safe loader.
+
+    Returns libyaml's CSafeLoader when PyYAML was built with it (same safety
+    as safe_load), otherwise the pure-Python SafeLoader.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_from_yaml(config_path: str) -> RegionConfig:
     """
     Load configuration from a YAML file.
@@ -39,12 +61,139 @@ def load_from_yaml(config_path: str) -> RegionConfig:
     """
     path = Path(config_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Pipes and devices (e.g. --config <(...) or /dev/stdin) have no stable
+    # stat to key on and resolve to unopenable names, so read them as given
+    if not stat.S_ISREG(st.st_mode) or not _yaml_cache_enabled():
+        return _parse_config(config_path, _stat_key(st), use_json_cache=False)
+
+    # RegionConfig is frozen, so an unchanged file can share the parsed result
+    return _load_yaml_cached(str(path.resolve()), _stat_key(st))
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int, int]:
+    """
+    Return the stat fields that identify one version of a file's contents.
+
+    mtime alone is not enough: tar, rsync -t and cp -p restore it, and some
+    filesystems only store it coarsely, so a same-size edit could keep it.
+    The inode and ctime cannot be set by users and change on every write.
+    """
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
 
-    with path.open("r") as f:
-        data = yaml.safe_load(f)
+def _yaml_cache_enabled() -> bool:
+    """Check whether parsed configs may be cached (AWS_VAULT_SHUFFLE_YAML_CACHE=0 disables)."""
+    return os.environ.get("AWS_VAULT_SHUFFLE_YAML_CACHE", "1") != "0"
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(resolved_path: str, stat_key: tuple[int, int, int, int]) -> RegionConfig:
+    """
+    Memoised _parse_config for regular files.
+
+    The resolved path names the same file the caller passed, so it serves as
+    both the cache key and the path to read; the stat key invalidates
+    edited files.
+    """
+    return _parse_config(resolved_path, stat_key, use_json_cache=True)
+
+
+def _parse_config(
+    path: str, stat_key: tuple[int, int, int, int], use_json_cache: bool
+) -> RegionConfig:
+    """
+    Read and parse a config file into a RegionConfig.
+
+    Args:
+        path: File to read
+        stat_key: File identity from _stat_key(), validating the JSON copy
+        use_json_cache: Whether to consult and refresh the JSON copy
+
+    Returns:
+        RegionConfig domain object
+    """
+    cache_path = _json_cache_path(path)
 
+    data = _read_json_cache(cache_path, stat_key) if use_json_cache else None
+    if data is not None:
+        return _region_config_from_dict(data)
+
+    import yaml
+
+    # Raw bytes: libyaml detects the encoding and decodes in C
+    data = yaml.load(_read_small_file(path), Loader=_yaml_loader())
+    config = _region_config_from_dict(data)
+    if use_json_cache:
+        _write_json_cache(cache_path, stat_key, data)
+    return config
+
+
+def _read_small_file(path: str) -> bytes:
+    """
+    Read a whole small file with raw os.read() calls.
+
+    Skips the buffered file object layers of Path.read_bytes(), which
+    dominate the cost for config-sized files. The first read is sized by
+    fstat(); reading continues until EOF so pipes, character devices and
+    files that grow while being read come back complete.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size or _READ_CHUNK)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, _READ_CHUNK))
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _json_cache_path(resolved_path: str) -> Path:
+    """Return the JSON copy location for a config file, one per source path."""
+    digest = hashlib.sha256(resolved_path.encode()).hexdigest()[:16]
+    return default_cache_dir() / "config" / f"{digest}.json"
+
+
+def _read_json_cache(cache_path: Path, stat_key: tuple[int, int, int, int]) -> Optional[Any]:
+    """
+    Return the cached parse of a config file if it matches the file's stat.
+
+    JSON decoding runs in C and is much cheaper than YAML, which matters for
+    the fresh process of every CLI run where the in-memory cache is empty.
+    """
+    try:
+        entry = json.loads(cache_path.read_bytes())
+        if entry["stat"] == list(stat_key):
+            return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, corrupt or stale entry; parse the YAML instead
+    return None
+
+
+def _write_json_cache(cache_path: Path, stat_key: tuple[int, int, int, int], data: Any) -> None:
+    """Atomically store a parsed config; failures only cost a future parse."""
+    try:
+        payload = json.dumps({"stat": stat_key, "data": data})
+    except (TypeError, ValueError):
+        return  # YAML values JSON cannot represent (e.g. dates); skip caching
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            f.write(payload)
+        os.replace(f.name, cache_path)
+    except OSError:
+        pass
+
+
+def _region_config_from_dict(data: Any) -> RegionConfig:
+    """Validate a parsed config document and build the RegionConfig."""
     if not isinstance(data, dict):
         raise ValueError("Configuration file must contain a YAML dictionary")
 
@@ -56,28 +205,61 @@ def load_from_yaml(config_path: str) -> RegionConfig:
     regions = data.get("regions")
     if not regions:
         raise ValueError("Configuration must specify 'regions'")
+    regions = tuple(regions)
+
+    # Checked before _canon_regions, which hashes the tuple
+    for region in regions:
+        if not isinstance(region, str):
+            raise ValueError(f"Invalid region format: {region}")
 
     # Extract optional fields
     assume_role_arn = data.get("assume_role_arn")
     external_id = data.get("external_id")
     session_name = data.get("session_name", "aws-vault-shuffle")
+    max_workers = data.get("max_workers", 20)
+    # bool is an int subclass, and int() would silently truncate floats
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+        raise ValueError(f"max_workers must be an integer, got: {max_workers!r}")
 
     # Create domain object (validation happens in __post_init__)
     return RegionConfig(
         source_account=str(source_account),
-        regions=tuple(regions),
+        regions=_canon_regions(regions),
         assume_role_arn=assume_role_arn,
         external_id=external_id,
         session_name=session_name,
+        max_workers=max_workers,
     )
 
 
+def _split_csv(text: str) -> tuple[str, ...]:
+    """
+    Split a comma-separated list, stripping each entry and dropping empty ones.
+
+    Only surrounding whitespace is removed, so an entry with internal
+    whitespace stays intact and fails validation downstream.
+    """
+    return tuple(filter(None, (s.strip() for s in text.split(","))))
+
+
+@functools.lru_cache(maxsize=256)
+def _canon_regions(regions: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Return a shared, interned copy of a region tuple, preserving order.
+
+    Only a few dozen region names exist, so repeated loads reuse one tuple
+    and one string per region and equality checks hit the identity fast path.
+    """
+    return tuple(sys.intern(r) for r in regions)
+
+
 def load_from_cli(
     account: str,
     regions: str,
     assume_role_arn: Optional[str] = None,
     external_id: Optional[str] = None,
     session_name: str = "aws-vault-shuffle",
+    max_workers: int = 20,
 ) -> RegionConfig:
     """
     Load configuration from CLI arguments.
@@ -88,6 +270,7 @@ def load_from_cli(
         assume_role_arn: Optional IAM role ARN to assume
         external_id: Optional external ID for role assumption
         session_name: Session name for role assumption
+        max_workers: Maximum concurrent AWS Backup API calls
 
     Returns:
         RegionConfig domain object
@@ -96,15 +279,16 @@ def load_from_cli(
         ValueError: If arguments are invalid
     """
     # Parse regions from comma-separated string
-    region_list = [r.strip() for r in regions.split(",") if r.strip()]
+    region_tuple = _canon_regions(_split_csv(regions))
 
     # Create domain object (validation happens in __post_init__)
     return RegionConfig(
         source_account=account,
-        regions=tuple(region_list),
+        regions=region_tuple,
         assume_role_arn=assume_role_arn,
         external_id=external_id,
         session_name=session_name,
+        max_workers=max_workers,
     )
 
 
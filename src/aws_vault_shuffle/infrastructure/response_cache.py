@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Infrastructure module for caching AWS Backup listings on disk."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from aws_vault_shuffle.application.inventory_service import BackupClient
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
+
+__version__ = "0.1.0"
+
+_T = TypeVar("_T")
+
+
+def file_info() -> dict[str, str]:
+    """Return file metadata."""
+    return {
+        "name": "response_cache",
+        "description": "TTL disk cache for AWS Backup listings",
+        "version": __version__,
+        "author": "John Ayers",
+        "last_updated": "2026-10-15",
+    }
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aws-vault-shuffle"
+
+
+class CachedBackupClient:
+    """
+    BackupClient decorator that caches listings as JSON files with a TTL.
+
+    Cache files live at ``{cache_dir}/{account}/{region}/{operation}_{hash}.json``
+    so repeated CLI runs against the same account skip the AWS round-trips
+    until the entries expire. Unreadable or expired entries are refetched.
+    """
+
+    def __init__(
+        self,
+        backup_client: BackupClient,
+        account: str,
+        ttl_seconds: int,
+        cache_dir: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the caching client.
+
+        Args:
+            backup_client: Client to delegate to on cache misses
+            account: AWS account number the listings belong to
+            ttl_seconds: How long cached listings stay valid
+            cache_dir: Root cache directory (default: ~/.cache/aws-vault-shuffle)
+            clock: Time source returning epoch seconds (injectable for tests)
+        """
+        self.backup_client = backup_client
+        self.account = account
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir or default_cache_dir()
+        self._clock = clock
+
+    def list_vaults(self, region: str) -> list[Vault]:
+        """List all backup vaults in a region, using the cache when fresh."""
+        path = self._cache_path(region, "list_vaults", {})
+        cached = self._load(path, lambda payload: [_vault_from_dict(v) for v in payload])
+        if cached is not None:
+            return cached
+
+        vaults = self.backup_client.list_vaults(region)
+        self._store(path, [_vault_to_dict(v) for v in vaults])
+        return vaults
+
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
+        """List all recovery points for a vault, using the cache when fresh."""
+        path = self._cache_path(region, "list_recovery_points", {"vault_name": vault_name})
+        cached = self._load(
+            path, lambda payload: tuple(_recovery_point_from_dict(rp) for rp in payload)
+        )
+        if cached is not None:
+            return cached
+
+        recovery_points = self.backup_client.list_recovery_points(vault_name, region)
+        self._store(path, [_recovery_point_to_dict(rp) for rp in recovery_points])
+        return recovery_points
+
+    def _cache_path(self, region: str, operation: str, params: dict[str, str]) -> Path:
+        """Build the cache file path for an operation and its parameters."""
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+        return self.cache_dir / self.account / region / f"{operation}_{digest}.json"
+
+    def _load(self, path: Path, rehydrate: Callable[[list[dict[str, Any]]], _T]) -> Optional[_T]:
+        """
+        Return the rehydrated cached payload if present and fresh, otherwise None.
+
+        Rehydration runs inside the miss handling, so an entry that parses as
+        JSON but no longer matches the domain objects is refetched too.
+        """
+        try:
+            entry = json.loads(path.read_bytes())
+            if self._clock() - entry["fetched_at"] < self.ttl_seconds:
+                return rehydrate(cast(list[dict[str, Any]], entry["payload"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or corrupt entry; treat as a miss
+        return None
+
+    def _store(self, path: Path, payload: list[dict[str, Any]]) -> None:
+        """Write a cache entry atomically; failures only cost a future miss."""
+        entry = {"fetched_at": self._clock(), "payload": payload}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(entry, f, default=_json_iso_datetimes)
+            os.replace(f.name, path)
+        except OSError:
+            pass
+
+
+def _json_iso_datetimes(obj: Any) -> str:
+    """JSON serializer for datetime objects."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _recovery_point_to_dict(rp: RecoveryPoint) -> dict[str, Any]:
+    """Convert a RecoveryPoint to a JSON-ready dict."""
+    return {
+        "arn": rp.arn,
+        "vault_name": rp.vault_name,
+        "resource_arn": rp.resource_arn,
+        "resource_type": rp.resource_type,
+        "creation_date": rp.creation_date,
+        "status": rp.status,
+        "backup_size_bytes": rp.backup_size_bytes,
+        "completion_date": rp.completion_date,
+    }
+
+
+def _recovery_point_from_dict(data: dict[str, Any]) -> RecoveryPoint:
+    """Rehydrate a RecoveryPoint from a dict produced by _recovery_point_to_dict."""
+    return RecoveryPoint(
+        arn=data["arn"],
+        vault_name=data["vault_name"],
+        resource_arn=data["resource_arn"],
+        resource_type=data["resource_type"],
+        creation_date=datetime.fromisoformat(data["creation_date"]),
+        status=data["status"],
+        backup_size_bytes=data["backup_size_bytes"],
+        completion_date=(
+            datetime.fromisoformat(data["completion_date"]) if data["completion_date"] else None
+        ),
+    )
+
+
+def _vault_to_dict(vault: Vault) -> dict[str, Any]:
+    """Convert a Vault (and its recovery points) to a JSON-ready dict."""
+    return {
+        "name": vault.name,
+        "arn": vault.arn,
+        "region": vault.region,
+        "recovery_points": [_recovery_point_to_dict(rp) for rp in vault.recovery_points],
+    }
+
+
+def _vault_from_dict(data: dict[str, Any]) -> Vault:
+    """Rehydrate a Vault from a dict produced by _vault_to_dict."""
+    return Vault(
+        name=data["name"],
+        arn=data["arn"],
+        region=data["region"],
+        recovery_points=tuple(_recovery_point_from_dict(rp) for rp in data["recovery_points"]),
+    )
+
+
+def main() -> None:
+    """Demonstrate the cache directory layout (for testing)."""
+    print(f"Cache directory: {default_cache_dir()}")
+    print("Entries: {account}/{region}/{operation}_{hash}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the user cache directory at a per-test temp dir."""
+    cache_dir = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir / "aws-vault-shuffle"
@@ -34,11 +34,6 @@ class TestListCommandIntegration:
             }
         ]
 
-        # Mock describe_backup_vault response
-        mock_backup_client.describe_backup_vault.return_value = {
-            "BackupVaultArn": "arn:aws:backup:us-east-1:123456789012:backup-vault:test-vault-1",
-        }
-
         # Mock list_recovery_points_by_backup_vault response
         def mock_paginate_recovery_points(**kwargs):
             vault_name = kwargs.get("BackupVaultName")
@@ -96,6 +91,8 @@ class TestListCommandIntegration:
         # Verify output
         captured = capsys.readouterr()
         assert "test-vault-1" in captured.out
+        # Vault ARNs come from list_backup_vaults; no per-vault describe call
+        mock_backup_client.describe_backup_vault.assert_not_called()
         # Currently just shows placeholder message, will be updated in implementation
 
     @patch("boto3.Session")
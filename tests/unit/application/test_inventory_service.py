@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Unit tests for inventory service."""
 
+import gc
+import threading
+import time
 from datetime import datetime, timezone
 
 import pytest
@@ -62,30 +65,109 @@ class FakeBackupClient:
             ],
         }
 
+        # O(1) vault lookup by (name, region)
+        self._vault_index = {
+            (v.name, v.region): v for vs in self.vaults_by_region.values() for v in vs
+        }
+
     def list_vaults(self, region: str) -> list[Vault]:
         """Return fake vaults for a region."""
         return self.vaults_by_region.get(region, [])
 
-    def list_recovery_points(self, vault_name: str, region: str) -> list[Vault]:
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
         """Return fake recovery points for a vault."""
-        rps = self.recovery_points.get((vault_name, region), [])
+        if (vault_name, region) in self._vault_index:
+            return tuple(self.recovery_points.get((vault_name, region), []))
 
-        # Find the vault
-        vaults = self.vaults_by_region.get(region, [])
-        vault = next((v for v in vaults if v.name == vault_name), None)
+        return ()
 
-        if vault:
-            # Return vault with recovery points
-            return [
-                Vault(
-                    name=vault.name,
-                    arn=vault.arn,
-                    region=vault.region,
-                    recovery_points=tuple(rps),
-                )
-            ]
 
-        return []
+class ConcurrencyTrackingClient(FakeBackupClient):
+    """Fake client that records the peak number of concurrent calls."""
+
+    def __init__(self):
+        """Initialize fake client with in-flight call counters."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_in_flight = 0
+
+    def _track(self, call, *args):
+        with self._lock:
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            time.sleep(0.01)
+            return call(*args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def list_vaults(self, region: str) -> list[Vault]:
+        """Return fake vaults for a region, tracking concurrency."""
+        return self._track(super().list_vaults, region)
+
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
+        """Return fake recovery points for a vault, tracking concurrency."""
+        return self._track(super().list_recovery_points, vault_name, region)
+
+
+class FailingFirstRegionClient(FakeBackupClient):
+    """Fake client whose first region fails while the others wait to be released."""
+
+    def __init__(self, failing_region: str):
+        """Initialize fake client with a call log and a release gate."""
+        super().__init__()
+        self.failing_region = failing_region
+        self.release = threading.Event()
+        self.calls: list[str] = []
+
+    def list_vaults(self, region: str) -> list[Vault]:
+        """Fail for the failing region; block other regions until released."""
+        self.calls.append(region)
+        if region == self.failing_region:
+            raise RuntimeError(f"listing failed in {region}")
+        self.release.wait(timeout=5)
+        return super().list_vaults(region)
+
+
+class GeneratedInventoryClient:
+    """Fake client that builds vaults and recovery points on demand and keeps none."""
+
+    def __init__(self, vault_count: int, points_per_vault: int):
+        """Initialize fake client with inventory sizes and a call counter."""
+        self.vault_count = vault_count
+        self.points_per_vault = points_per_vault
+        self._lock = threading.Lock()
+        self.recovery_point_calls = 0
+
+    def list_vaults(self, region: str) -> list[Vault]:
+        """Return generated vaults for a region."""
+        return [
+            Vault(
+                name=f"vault-{i}",
+                arn=f"arn:aws:backup:{region}:123456789012:backup-vault:vault-{i}",
+                region=region,
+            )
+            for i in range(self.vault_count)
+        ]
+
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
+        """Return freshly generated recovery points for a vault."""
+        with self._lock:
+            self.recovery_point_calls += 1
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return tuple(
+            RecoveryPoint(
+                arn=f"arn:aws:backup:{region}:123456789012:recovery-point:{vault_name}-{i}",
+                vault_name=vault_name,
+                resource_arn=f"arn:aws:ec2:{region}:123456789012:volume/vol-{i}",
+                resource_type="EBS",
+                creation_date=created,
+                status="COMPLETED",
+            )
+            for i in range(self.points_per_vault)
+        )
 
 
 class TestInventoryService:
@@ -144,6 +226,7 @@ class TestInventoryService:
         vault_west_2 = next(v for v in vaults if v.name == "vault-west-2")
         assert vault_west_2.recovery_point_count() == 1
         assert vault_west_2.recovery_points[0].resource_type == "RDS"
+        assert vault_west_2.arn == "arn:aws:backup:us-west-2:123456789012:backup-vault:vault-west-2"
 
     def test_list_all_vaults_empty_region(self):
         """Test listing vaults from a region with no vaults."""
@@ -158,3 +241,99 @@ class TestInventoryService:
         vaults = service.list_all_vaults(config)
 
         assert len(vaults) == 0
+
+    def test_list_all_vaults_preserves_region_order(self):
+        """Test that concurrent listing still returns vaults in region order."""
+        fake_client = FakeBackupClient()
+        service = InventoryService(fake_client)
+
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-west-2", "us-east-1"),
+            max_workers=1,
+        )
+
+        vaults = service.list_all_vaults(config)
+
+        assert [v.name for v in vaults] == ["vault-west-1", "vault-west-2", "vault-east-1"]
+
+    def test_list_all_vaults_bounds_concurrent_calls(self):
+        """Test that in-flight AWS calls never exceed max_workers."""
+        fake_client = ConcurrencyTrackingClient()
+        service = InventoryService(fake_client)
+
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-east-1", "us-west-2", "eu-west-1"),
+            max_workers=2,
+        )
+
+        vaults = service.list_all_vaults(config)
+
+        assert len(vaults) == 3
+        assert fake_client.peak_in_flight <= 2
+
+    def test_iter_all_vaults_cancels_queued_calls_after_failure(self):
+        """Test that a failed listing stops the remaining queued AWS calls."""
+        regions = ("us-east-1",) + tuple(f"xx-test-{i}" for i in range(1, 20))
+        fake_client = FailingFirstRegionClient("us-east-1")
+        service = InventoryService(fake_client)
+
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=regions,
+            max_workers=1,
+        )
+
+        with pytest.raises(RuntimeError, match="us-east-1"):
+            list(service.iter_all_vaults(config))
+
+        fake_client.release.set()
+        for thread in threading.enumerate():
+            if thread.name.startswith("ThreadPoolExecutor"):
+                thread.join(timeout=5)
+
+        # At most the listing the worker had already dequeued may still run
+        assert len(fake_client.calls) <= 2
+
+    def test_iter_all_vaults_releases_consumed_vaults(self):
+        """Test that vaults already yielded are not kept alive by the iterator."""
+        fake_client = GeneratedInventoryClient(vault_count=100, points_per_vault=100)
+        service = InventoryService(fake_client)
+
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-east-1",),
+            max_workers=2,
+        )
+
+        vaults = service.iter_all_vaults(config)
+        for _ in range(96):
+            next(vaults)
+
+        gc.collect()
+        alive = sum(isinstance(obj, RecoveryPoint) for obj in gc.get_objects())
+        vaults.close()
+
+        # At most the look-ahead window of 2 * max_workers vaults stays alive
+        assert alive <= 2 * config.max_workers * fake_client.points_per_vault
+
+    def test_iter_all_vaults_limits_look_ahead(self):
+        """Test that recovery point listings wait for the caller to catch up."""
+        fake_client = GeneratedInventoryClient(vault_count=50, points_per_vault=1)
+        service = InventoryService(fake_client)
+
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-east-1",),
+            max_workers=2,
+        )
+
+        vaults = service.iter_all_vaults(config)
+        next(vaults)
+        time.sleep(0.05)
+        calls = fake_client.recovery_point_calls
+        vaults.close()
+
+        # The yielded vault plus a full look-ahead window
+        assert calls <= 2 * config.max_workers + 1
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Unit tests for the token bucket rate limiter."""
+
+import pytest
+
+from aws_vault_shuffle.application.rate_limiter import TokenBucket
+
+
+class FakeTime:
+    """Fake monotonic clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_passes_without_waiting(self):
+        """Test that a full bucket admits burst calls immediately."""
+        fake_time = FakeTime()
+        bucket = TokenBucket(rate=10, burst=3, clock=fake_time.clock, sleep=fake_time.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert fake_time.sleeps == []
+
+    def test_waits_for_refill_after_burst(self):
+        """Test that calls beyond the burst are paced at the refill rate."""
+        fake_time = FakeTime()
+        bucket = TokenBucket(rate=10, burst=1, clock=fake_time.clock, sleep=fake_time.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert fake_time.now == pytest.approx(0.2)
+
+    def test_default_burst_is_one_second(self):
+        """Test the default capacity is one second of tokens."""
+        assert TokenBucket(rate=10).burst == 10
+        assert TokenBucket(rate=0.5).burst == 1
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="rate"):
+            TokenBucket(rate=0)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for domain model tests.
+
+Domain objects are frozen, so session-scoped instances are safe to share.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
+
+
+@pytest.fixture(scope="session")
+def sample_completed_rp():
+    """Provide a completed EBS recovery point."""
+    return RecoveryPoint(
+        arn="arn:completed",
+        vault_name="vault",
+        resource_arn="arn:resource1",
+        resource_type="EBS",
+        creation_date=datetime.now(timezone.utc),
+        status="COMPLETED",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_failed_rp():
+    """Provide a failed RDS recovery point."""
+    return RecoveryPoint(
+        arn="arn:failed",
+        vault_name="vault",
+        resource_arn="arn:resource2",
+        resource_type="RDS",
+        creation_date=datetime.now(timezone.utc),
+        status="FAILED",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_vault_two_rps(sample_completed_rp, sample_failed_rp):
+    """Provide a vault holding one completed and one failed recovery point."""
+    return Vault(
+        name="test-vault",
+        arn="arn:test",
+        region="us-east-1",
+        recovery_points=(sample_completed_rp, sample_failed_rp),
+    )
@@ -19,6 +19,7 @@ class TestRegionConfig:
         assert config.source_account == "123456789012"
         assert config.regions == ("us-east-1", "us-west-2")
         assert config.session_name == "aws-vault-shuffle"
+        assert config.max_workers == 20
 
     def test_config_with_optional_fields(self):
         """Test config with optional cross-account fields."""
@@ -50,6 +51,14 @@ class TestRegionConfig:
                 regions=("us-east-1",),
             )
 
+    def test_invalid_account_number_non_ascii_digits(self):
+        """Test validation fails for Unicode digits outside 0-9."""
+        with pytest.raises(ValueError, match="12-digit number"):
+            RegionConfig(
+                source_account="\u0661" * 12,  # Arabic-Indic digit one
+                regions=("us-east-1",),
+            )
+
     def test_empty_regions(self):
         """Test validation fails for empty regions."""
         with pytest.raises(ValueError, match="At least one region"):
@@ -66,6 +75,41 @@ class TestRegionConfig:
                 regions=("invalid",),  # No hyphen
             )
 
+    def test_invalid_region_missing_number(self):
+        """Test validation fails for a region without its numeric suffix."""
+        with pytest.raises(ValueError, match="Invalid region format: us-east"):
+            RegionConfig(
+                source_account="123456789012",
+                regions=("us-east-1", "us-east"),
+            )
+
+    def test_multi_part_region_names(self):
+        """Test that partition-prefixed regions are accepted."""
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-gov-west-1", "ap-southeast-2", "cn-northwest-1"),
+        )
+
+        assert config.region_count() == 3
+
+    def test_long_prefix_region_names(self):
+        """Test that regions with a prefix longer than two letters are accepted."""
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-gov-west-1", "eusc-de-east-1"),
+        )
+
+        assert config.regions == ("us-gov-west-1", "eusc-de-east-1")
+
+    def test_invalid_max_workers(self):
+        """Test validation fails for a non-positive worker count."""
+        with pytest.raises(ValueError, match="max_workers"):
+            RegionConfig(
+                source_account="123456789012",
+                regions=("us-east-1",),
+                max_workers=0,
+            )
+
     def test_region_count(self):
         """Test region_count() method."""
         config = RegionConfig(
@@ -100,3 +144,13 @@ class TestRegionConfig:
 
         with pytest.raises(Exception):  # FrozenInstanceError
             config.source_account = "999999999999"
+
+    def test_config_uses_slots(self):
+        """Test that RegionConfig instances carry no per-instance __dict__."""
+        config = RegionConfig(
+            source_account="123456789012",
+            regions=("us-east-1",),
+        )
+
+        assert "__slots__" in RegionConfig.__dict__
+        assert not hasattr(config, "__dict__")
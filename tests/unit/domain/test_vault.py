@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 """Unit tests for vault domain models."""
 
+import copy
+import dataclasses
+import pickle
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
 
-from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault, freeze_reference_time
 
 
 class TestRecoveryPoint:
@@ -27,133 +34,234 @@ class TestRecoveryPoint:
         assert rp.resource_type == "EBS"
         assert rp.status == "COMPLETED"
 
-    def test_recovery_point_is_completed(self):
+    def test_recovery_point_is_completed(self, sample_completed_rp):
         """Test is_completed() method."""
+        assert sample_completed_rp.is_completed() is True
+
+    def test_recovery_point_is_failed(self, sample_failed_rp):
+        """Test is_failed() method."""
+        assert sample_failed_rp.is_failed() is True
+
+    def test_recovery_point_age_days(self):
+        """Test age_days() calculation."""
+        creation = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        reference = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+
         rp = RecoveryPoint(
             arn="arn:test",
             vault_name="vault",
             resource_arn="arn:resource",
             resource_type="EBS",
-            creation_date=datetime.now(timezone.utc),
+            creation_date=creation,
             status="COMPLETED",
         )
 
-        assert rp.is_completed() is True
+        assert rp.age_days(reference) == 9
 
-    def test_recovery_point_is_failed(self):
-        """Test is_failed() method."""
+    def test_recovery_point_age_days_partial_day(self):
+        """Test age_days() floors partial days like timedelta.days."""
         rp = RecoveryPoint(
             arn="arn:test",
             vault_name="vault",
             resource_arn="arn:resource",
             resource_type="EBS",
-            creation_date=datetime.now(timezone.utc),
-            status="FAILED",
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            status="COMPLETED",
         )
 
-        assert rp.is_failed() is True
-
-    def test_recovery_point_age_days(self):
-        """Test age_days() calculation."""
-        creation = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        reference = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        assert rp.age_days(datetime(2025, 1, 2, 11, 59, 59, tzinfo=timezone.utc)) == 0
+        assert rp.age_days(datetime(2025, 1, 1, 11, 0, 0, tzinfo=timezone.utc)) == -1
 
+    def test_recovery_point_age_days_frozen_reference(self):
+        """Test age_days() uses the time pinned by freeze_reference_time()."""
         rp = RecoveryPoint(
             arn="arn:test",
             vault_name="vault",
             resource_arn="arn:resource",
             resource_type="EBS",
-            creation_date=creation,
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
             status="COMPLETED",
         )
 
-        assert rp.age_days(reference) == 9
+        with freeze_reference_time(datetime(2025, 1, 31, 12, 0, 0, tzinfo=timezone.utc)):
+            assert rp.age_days() == 30
 
-    def test_recovery_point_immutable(self):
-        """Test that RecoveryPoint is immutable (frozen)."""
+        assert rp.age_days() > 30
+
+    def test_recovery_point_age_days_naive_across_dst(self, monkeypatch):
+        """Test naive datetimes count calendar days across a DST change."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            rp = RecoveryPoint(
+                arn="arn:test",
+                vault_name="vault",
+                resource_arn="arn:resource",
+                resource_type="EBS",
+                creation_date=datetime(2025, 3, 8, 12, 0, 0),
+                status="COMPLETED",
+            )
+            reference = datetime(2025, 3, 9, 12, 0, 0)
+
+            assert rp.age_days(reference) == 1
+            with freeze_reference_time(reference):
+                assert rp.age_days() == 1
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_recovery_point_age_days_shared_zone_across_dst(self):
+        """Test aware datetimes in one DST-observing zone count wall-clock days."""
+        new_york = ZoneInfo("America/New_York")
         rp = RecoveryPoint(
             arn="arn:test",
             vault_name="vault",
             resource_arn="arn:resource",
             resource_type="EBS",
-            creation_date=datetime.now(timezone.utc),
+            creation_date=datetime(2024, 3, 9, 12, 0, 0, tzinfo=new_york),
             status="COMPLETED",
         )
+        reference = datetime(2024, 3, 10, 12, 0, 0, tzinfo=new_york)
 
-        with pytest.raises(Exception):  # FrozenInstanceError
-            rp.status = "FAILED"
+        assert rp.age_days(reference) == 1
+        with freeze_reference_time(reference):
+            assert rp.age_days() == 1
+        # A different zone compares instants, as timedelta does: 23 hours
+        assert rp.age_days(reference.astimezone(timezone.utc)) == 0
 
+    def test_recovery_point_age_days_rejects_mixed_awareness(self):
+        """Test mixing naive and aware datetimes raises like timedelta does."""
+        aware = RecoveryPoint(
+            arn="arn:test",
+            vault_name="vault",
+            resource_arn="arn:resource",
+            resource_type="EBS",
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            status="COMPLETED",
+        )
+        naive = dataclasses.replace(aware, creation_date=datetime(2025, 1, 1, 12, 0, 0))
 
-class TestVault:
-    """Tests for Vault domain model."""
+        with pytest.raises(TypeError):
+            aware.age_days(datetime(2025, 1, 10, 12, 0, 0))
+        with pytest.raises(TypeError):
+            naive.age_days(datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc))
 
-    def test_create_vault(self):
-        """Test creating a vault with required fields."""
-        vault = Vault(
-            name="test-vault",
-            arn="arn:aws:backup:us-east-1:123456789012:backup-vault:test-vault",
-            region="us-east-1",
+    def test_freeze_reference_time_is_local_to_thread(self):
+        """Test a pinned reference time is not seen by other threads."""
+        rp = RecoveryPoint(
+            arn="arn:test",
+            vault_name="vault",
+            resource_arn="arn:resource",
+            resource_type="EBS",
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            status="COMPLETED",
         )
+        ages = []
 
-        assert vault.name == "test-vault"
-        assert vault.region == "us-east-1"
-        assert vault.recovery_points == ()
+        with freeze_reference_time(datetime(2025, 1, 31, 12, 0, 0, tzinfo=timezone.utc)):
+            worker = threading.Thread(target=lambda: ages.append(rp.age_days()))
+            worker.start()
+            worker.join()
+            assert rp.age_days() == 30
 
-    def test_vault_recovery_point_count(self):
-        """Test recovery_point_count() method."""
-        rp1 = RecoveryPoint(
-            arn="arn:test1",
+        assert ages[0] > 30
+
+    def test_recovery_point_interns_repeated_strings(self):
+        """Test that equal vault names, types and statuses share one string object."""
+        rps = [
+            RecoveryPoint(
+                arn=f"arn:test{i}",
+                vault_name="".join(["va", "ult"]),
+                resource_arn="arn:resource",
+                resource_type="".join(["E", "BS"]),
+                creation_date=datetime.now(timezone.utc),
+                status="".join(["COMP", "LETED"]),
+            )
+            for i in range(2)
+        ]
+
+        assert rps[0].vault_name is rps[1].vault_name
+        assert rps[0].resource_type is rps[1].resource_type
+        assert rps[0].status is rps[1].status
+
+    def test_recovery_point_immutable(self, sample_completed_rp):
+        """Test that RecoveryPoint is immutable (frozen)."""
+        with pytest.raises(Exception):  # FrozenInstanceError
+            sample_completed_rp.status = "FAILED"
+
+    def test_recovery_point_equality_compares_all_fields(self):
+        """Test that a status change makes otherwise identical snapshots unequal."""
+        created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        running = RecoveryPoint(
+            arn="arn:test:rp1",
             vault_name="vault",
-            resource_arn="arn:resource1",
+            resource_arn="arn:resource",
             resource_type="EBS",
-            creation_date=datetime.now(timezone.utc),
+            creation_date=created,
+            status="RUNNING",
+        )
+        completed = RecoveryPoint(
+            arn="arn:test:rp1",
+            vault_name="vault",
+            resource_arn="arn:resource",
+            resource_type="EBS",
+            creation_date=created,
             status="COMPLETED",
+            backup_size_bytes=1000,
         )
-        rp2 = RecoveryPoint(
-            arn="arn:test2",
+        other = RecoveryPoint(
+            arn="arn:test:rp2",
             vault_name="vault",
-            resource_arn="arn:resource2",
-            resource_type="RDS",
-            creation_date=datetime.now(timezone.utc),
+            resource_arn="arn:resource",
+            resource_type="EBS",
+            creation_date=created,
             status="COMPLETED",
         )
 
-        vault = Vault(
-            name="test-vault",
-            arn="arn:test",
-            region="us-east-1",
-            recovery_points=(rp1, rp2),
-        )
+        assert running != completed
+        assert running == dataclasses.replace(completed, status="RUNNING", backup_size_bytes=None)
 
-        assert vault.recovery_point_count() == 2
+        # ARN-keyed lookups go through a dict rather than equality
+        by_arn = {rp.arn: rp for rp in (running, completed, other)}
+        assert by_arn == {"arn:test:rp1": completed, "arn:test:rp2": other}
 
-    def test_vault_completed_recovery_points(self):
-        """Test completed_recovery_points() filters correctly."""
-        rp_completed = RecoveryPoint(
-            arn="arn:completed",
+    def test_recovery_point_uses_slots(self):
+        """Test that RecoveryPoint instances carry no per-instance __dict__."""
+        rp = RecoveryPoint(
+            arn="arn:test",
             vault_name="vault",
-            resource_arn="arn:resource1",
+            resource_arn="arn:resource",
             resource_type="EBS",
             creation_date=datetime.now(timezone.utc),
             status="COMPLETED",
         )
-        rp_failed = RecoveryPoint(
-            arn="arn:failed",
-            vault_name="vault",
-            resource_arn="arn:resource2",
-            resource_type="RDS",
-            creation_date=datetime.now(timezone.utc),
-            status="FAILED",
-        )
 
+        assert "__slots__" in RecoveryPoint.__dict__
+        assert not hasattr(rp, "__dict__")
+
+
+class TestVault:
+    """Tests for Vault domain model."""
+
+    def test_create_vault(self):
+        """Test creating a vault with required fields."""
         vault = Vault(
             name="test-vault",
-            arn="arn:test",
+            arn="arn:aws:backup:us-east-1:123456789012:backup-vault:test-vault",
             region="us-east-1",
-            recovery_points=(rp_completed, rp_failed),
         )
 
-        completed = vault.completed_recovery_points()
+        assert vault.name == "test-vault"
+        assert vault.region == "us-east-1"
+        assert vault.recovery_points == ()
+
+    def test_vault_recovery_point_count(self, sample_vault_two_rps):
+        """Test recovery_point_count() method."""
+        assert sample_vault_two_rps.recovery_point_count() == 2
+
+    def test_vault_completed_recovery_points(self, sample_vault_two_rps):
+        """Test completed_recovery_points() filters correctly."""
+        completed = sample_vault_two_rps.completed_recovery_points()
         assert len(completed) == 1
         assert completed[0].arn == "arn:completed"
 
@@ -196,13 +304,104 @@ class TestVault:
 
         assert vault.total_backup_size_bytes() == 3000
 
-    def test_vault_immutable(self):
-        """Test that Vault is immutable (frozen)."""
-        vault = Vault(
-            name="test-vault",
-            arn="arn:test",
-            region="us-east-1",
+    def test_vault_resource_type_counts(self):
+        """Test resource_type_counts() histogram."""
+        rps = tuple(
+            RecoveryPoint(
+                arn=f"arn:test{i}",
+                vault_name="vault",
+                resource_arn=f"arn:resource{i}",
+                resource_type=resource_type,
+                creation_date=datetime.now(timezone.utc),
+                status="COMPLETED",
+            )
+            for i, resource_type in enumerate(["EBS", "RDS", "EBS"])
         )
 
+        vault = Vault(name="test-vault", arn="arn:test", region="us-east-1", recovery_points=rps)
+
+        assert dict(vault.resource_type_counts()) == {"EBS": 2, "RDS": 1}
+        with pytest.raises(TypeError):
+            vault.resource_type_counts()["EBS"] = 0
+
+    def test_vault_recovery_point_ages_days(self):
+        """Test bulk ages match per-recovery-point age_days."""
+        reference = datetime(2025, 1, 11, 12, 0, tzinfo=timezone.utc)
+        rps = tuple(
+            RecoveryPoint(
+                arn=f"arn:test:rp{day}",
+                vault_name="vault",
+                resource_arn="arn:resource",
+                resource_type="EBS",
+                creation_date=datetime(2025, 1, day, tzinfo=timezone.utc),
+                status="COMPLETED",
+            )
+            for day in (1, 5, 11)
+        )
+        vault = Vault(name="vault", arn="arn:test", region="us-east-1", recovery_points=rps)
+
+        assert vault.recovery_point_ages_days(reference) == (10, 6, 0)
+        assert vault.recovery_point_ages_days(reference) == tuple(
+            rp.age_days(reference) for rp in rps
+        )
+
+    def test_vault_equality_ignores_derived_fields(self):
+        """Test that precomputed aggregates do not affect equality or repr."""
+        rp = RecoveryPoint(
+            arn="arn:test1",
+            vault_name="vault",
+            resource_arn="arn:resource1",
+            resource_type="EBS",
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            status="COMPLETED",
+            backup_size_bytes=1000,
+        )
+
+        vault_a = Vault(
+            name="test-vault", arn="arn:test", region="us-east-1", recovery_points=(rp,)
+        )
+        vault_b = Vault(
+            name="test-vault", arn="arn:test", region="us-east-1", recovery_points=(rp,)
+        )
+
+        assert vault_a == vault_b
+        assert hash(vault_a) == hash(vault_b)
+        assert "_total_size" not in repr(vault_a)
+
+    def test_vault_copy_and_pickle_round_trip(self, sample_vault_two_rps):
+        """Test that deepcopy and pickle rebuild the vault and its aggregates."""
+        for clone in (
+            copy.deepcopy(sample_vault_two_rps),
+            pickle.loads(pickle.dumps(sample_vault_two_rps)),
+        ):
+            assert clone == sample_vault_two_rps
+            assert dict(clone.resource_type_counts()) == {"EBS": 1, "RDS": 1}
+            assert clone.completed_recovery_points() == (sample_vault_two_rps.recovery_points[0],)
+
+    def test_vault_fields_exclude_derived_aggregates(self, sample_vault_two_rps):
+        """Test that precomputed aggregates stay out of fields() and asdict()."""
+        assert [f.name for f in dataclasses.fields(Vault)] == [
+            "name",
+            "arn",
+            "region",
+            "recovery_points",
+        ]
+        assert "_creation_ts" not in dataclasses.asdict(sample_vault_two_rps)["recovery_points"][0]
+
+    def test_vault_immutable(self, sample_vault_two_rps):
+        """Test that Vault is immutable (frozen)."""
         with pytest.raises(Exception):  # FrozenInstanceError
-            vault.name = "new-name"
+            sample_vault_two_rps.name = "new-name"
+
+    def test_vault_uses_slots(self):
+        """Test that Vault instances carry no per-instance __dict__."""
+        vault = Vault(name="test-vault", arn="arn:test", region="us-east-1")
+
+        assert "__slots__" in Vault.__dict__
+        assert not hasattr(vault, "__dict__")
+
+    def test_domain_objects_support_weakrefs(self, sample_vault_two_rps):
+        """Test that slotted recovery points and vaults can still be weakly referenced."""
+        assert weakref.ref(sample_vault_two_rps)() is sample_vault_two_rps
+        rp = sample_vault_two_rps.recovery_points[0]
+        assert weakref.ref(rp)() is rp
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Unit tests for AWSBackupAdapter session handling."""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws_vault_shuffle.infrastructure.aws_backup_adapter import AWSBackupAdapter
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/BackupReader"
+
+
+def _credentials(expires_in: timedelta) -> dict:
+    """Build an STS Credentials block expiring after the given delta."""
+    return {
+        "AccessKeyId": "AKIA",
+        "SecretAccessKey": "secret",
+        "SessionToken": "token",
+        "Expiration": datetime.now(timezone.utc) + expires_in,
+    }
+
+
+class TestAWSBackupAdapterSessions:
+    """Test cases for AWSBackupAdapter session and credential caching."""
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_assume_role_once_across_regions(self, mock_client, mock_session):
+        """Test that one AssumeRole call is shared by all regions."""
+        sts = mock_client.return_value
+        sts.assume_role.return_value = {"Credentials": _credentials(timedelta(hours=1))}
+
+        adapter = AWSBackupAdapter(assume_role_arn=ROLE_ARN, external_id="ext")
+        for region in ("us-east-1", "us-west-2", "eu-west-1"):
+            adapter._get_session(region)
+
+        sts.assume_role.assert_called_once_with(
+            RoleArn=ROLE_ARN,
+            RoleSessionName="aws-vault-shuffle",
+            DurationSeconds=3600,
+            ExternalId="ext",
+        )
+        assert mock_session.call_count == 3
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_expiring_credentials_are_refreshed(self, mock_client, mock_session):
+        """Test that credentials near expiry trigger a new AssumeRole call."""
+        sts = mock_client.return_value
+        sts.assume_role.side_effect = [
+            {"Credentials": _credentials(timedelta(seconds=30))},
+            {"Credentials": _credentials(timedelta(hours=1))},
+        ]
+        mock_session.side_effect = lambda **kwargs: MagicMock()
+
+        adapter = AWSBackupAdapter(assume_role_arn=ROLE_ARN)
+        first = adapter._get_session("us-east-1")
+        second = adapter._get_session("us-east-1")
+
+        assert sts.assume_role.call_count == 2
+        assert first is not second
+        mock_client.assert_called_once_with("sts")
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_concurrent_first_access_assumes_role_once(self, mock_client, mock_session):
+        """Test that racing threads share one AssumeRole call and one session."""
+        sts = mock_client.return_value
+
+        def slow_assume_role(**kwargs):
+            time.sleep(0.02)
+            return {"Credentials": _credentials(timedelta(hours=1))}
+
+        sts.assume_role.side_effect = slow_assume_role
+        mock_session.side_effect = lambda **kwargs: MagicMock()
+
+        adapter = AWSBackupAdapter(assume_role_arn=ROLE_ARN)
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(adapter._get_session("us-east-1")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        sts.assume_role.assert_called_once()
+        assert mock_session.call_count == 1
+        assert all(s is sessions[0] for s in sessions)
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_session_stored_with_old_credentials_is_rebuilt(self, mock_client, mock_session):
+        """Test that a session stored after a refresh, from older credentials, is not reused."""
+        old_credentials = _credentials(timedelta(seconds=30))
+        mock_client.return_value.assume_role.return_value = {
+            "Credentials": _credentials(timedelta(hours=1))
+        }
+        mock_session.side_effect = lambda **kwargs: MagicMock()
+
+        adapter = AWSBackupAdapter(assume_role_arn=ROLE_ARN)
+        adapter._get_session("us-west-2")
+
+        # A slower thread that fetched the old credentials stores its session late
+        stale = MagicMock()
+        adapter._sessions["us-east-1"] = (old_credentials, stale)
+
+        session = adapter._get_session("us-east-1")
+        assert session is not stale
+        assert adapter._get_session("us-east-1") is session
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_default_credentials_skip_sts(self, mock_client, mock_session):
+        """Test that no role means no STS call and cached sessions per region."""
+        adapter = AWSBackupAdapter()
+
+        assert adapter._get_session("us-east-1") is adapter._get_session("us-east-1")
+        mock_client.assert_not_called()
+        mock_session.assert_called_once_with(region_name="us-east-1")
+
+    @patch("boto3.Session")
+    def test_backup_clients_share_retry_config(self, mock_session):
+        """Test that backup clients get adaptive retries and a larger pool."""
+        adapter = AWSBackupAdapter()
+        adapter._get_backup_client("us-east-1")
+        adapter._get_backup_client("us-west-2")
+
+        client_calls = mock_session.return_value.client.call_args_list
+        configs = [call.kwargs["config"] for call in client_calls]
+        assert configs[0] is configs[1]
+        assert configs[0].retries == {"mode": "adaptive", "max_attempts": 10}
+        assert configs[0].max_pool_connections == 20
+
+    @pytest.mark.parametrize(("max_workers", "pool_size"), [(100, 100), (4, 10)])
+    def test_connection_pool_sized_for_workers(self, max_workers, pool_size):
+        """Test that each client's pool holds a connection per worker, at least 10."""
+        adapter = AWSBackupAdapter(max_workers=max_workers)
+
+        assert adapter._client_config.max_pool_connections == pool_size
+
+    @patch("boto3.Session")
+    def test_backup_client_cached_per_region(self, mock_session):
+        """Test that repeated calls for a region reuse one backup client."""
+        adapter = AWSBackupAdapter()
+
+        first = adapter._get_backup_client("us-east-1")
+        second = adapter._get_backup_client("us-east-1")
+
+        assert first is second
+        mock_session.return_value.client.assert_called_once()
+
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    def test_backup_client_rebuilt_after_refresh(self, mock_client, mock_session):
+        """Test that a credential refresh replaces the cached backup client."""
+        mock_client.return_value.assume_role.side_effect = [
+            {"Credentials": _credentials(timedelta(seconds=30))},
+            {"Credentials": _credentials(timedelta(hours=1))},
+        ]
+        mock_session.side_effect = lambda **kwargs: MagicMock()
+
+        adapter = AWSBackupAdapter(assume_role_arn=ROLE_ARN)
+
+        first = adapter._get_backup_client("us-east-1")
+        assert adapter._get_backup_client("us-east-1") is not first
+
+
+class TestAWSBackupAdapterPagination:
+    """Test cases for AWSBackupAdapter paginator usage."""
+
+    @patch("boto3.Session")
+    def test_paginators_request_largest_page(self, mock_session):
+        """Test that both listings ask for 1000 items per page."""
+        client = mock_session.return_value.client.return_value
+        paginate = client.get_paginator.return_value.paginate
+        paginate.return_value = []
+
+        adapter = AWSBackupAdapter()
+        adapter.list_vaults("us-east-1")
+        adapter.list_recovery_points("vault-1", "us-east-1")
+
+        assert paginate.call_args_list[0].kwargs == {"PaginationConfig": {"PageSize": 1000}}
+        assert paginate.call_args_list[1].kwargs == {
+            "BackupVaultName": "vault-1",
+            "PaginationConfig": {"PageSize": 1000},
+        }
+
+    def test_before_request_runs_for_every_page(self, monkeypatch):
+        """Test that the request hook fires per API request, not per listing."""
+        from botocore.awsrequest import AWSResponse
+
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        requests = []
+        adapter = AWSBackupAdapter(before_request=lambda: requests.append(1))
+        client = adapter._get_backup_client("us-east-1")
+
+        pages = iter(
+            [
+                {
+                    "BackupVaultList": [{"BackupVaultName": "vault-0", "BackupVaultArn": "arn:0"}],
+                    "NextToken": "page-2",
+                },
+                {"BackupVaultList": [{"BackupVaultName": "vault-1", "BackupVaultArn": "arn:1"}]},
+            ]
+        )
+
+        class _Body:
+            def __init__(self, data: bytes):
+                self.data = data
+
+            def stream(self, **kwargs):
+                yield self.data
+
+        def fake_send(request, **kwargs):
+            body = json.dumps(next(pages)).encode()
+            return AWSResponse(request.url, 200, {}, _Body(body))
+
+        # Answer each HTTP request locally instead of calling AWS
+        client.meta.events.register("before-send.backup", fake_send)
+
+        vaults = adapter.list_vaults("us-east-1")
+
+        assert [v.name for v in vaults] == ["vault-0", "vault-1"]
+        assert len(requests) == 2
+
+
+class TestAWSBackupAdapterStreaming:
+    """Test cases for the generator-based listing methods."""
+
+    @patch("boto3.Session")
+    def test_iter_vaults_yields_before_next_page(self, mock_session):
+        """Test that vaults are yielded before later pages are fetched."""
+        fetched = []
+
+        def pages(**kwargs):
+            for i in range(2):
+                fetched.append(i)
+                yield {
+                    "BackupVaultList": [
+                        {"BackupVaultName": f"vault-{i}", "BackupVaultArn": f"arn:vault-{i}"}
+                    ]
+                }
+
+        client = mock_session.return_value.client.return_value
+        client.get_paginator.return_value.paginate.side_effect = pages
+
+        vaults = AWSBackupAdapter().iter_vaults("us-east-1")
+
+        assert next(vaults).name == "vault-0"
+        assert fetched == [0]
+        assert [v.name for v in vaults] == ["vault-1"]
+
+    @patch("boto3.Session")
+    def test_iter_recovery_points_wraps_client_errors(self, mock_session):
+        """Test that AWS errors raised mid-stream become RuntimeError."""
+        client = mock_session.return_value.client.return_value
+        client.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "ListRecoveryPoints"
+        )
+
+        with pytest.raises(RuntimeError, match="Failed to list recovery points for vault v1"):
+            AWSBackupAdapter().list_recovery_points("v1", "us-east-1")
@@ -1,18 +1,27 @@
 #!/usr/bin/env python3
 """Unit tests for config loader."""
 
-import tempfile
-from pathlib import Path
+import os
+import sys
+import threading
+from unittest.mock import patch
 
 import pytest
 import yaml
 
 from aws_vault_shuffle.domain.config import RegionConfig
 from aws_vault_shuffle.infrastructure.config_loader import (
+    _load_yaml_cached,
+    _read_small_file,
+    _split_csv,
+    _yaml_loader,
     load_from_cli,
     load_from_yaml,
 )
 
+# libyaml-backed dumper when available, mirroring the loader under test
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TestLoadFromCLI:
     """Tests for load_from_cli()."""
@@ -37,6 +46,34 @@ class TestLoadFromCLI:
 
         assert config.regions == ("us-east-1", "us-west-2", "eu-west-1")
 
+    def test_load_from_cli_skips_empty_entries(self):
+        """Test loading ignores blank entries and surrounding whitespace."""
+        config = load_from_cli(
+            account="123456789012",
+            regions=" us-east-1,, \tus-west-2 ,",
+        )
+
+        assert config.regions == ("us-east-1", "us-west-2")
+
+    def test_load_from_cli_shares_region_tuple(self):
+        """Test repeated loads reuse one interned regions tuple."""
+        first = load_from_cli(account="123456789012", regions="us-east-1,us-west-2")
+        second = load_from_cli(account="123456789012", regions="us-east-1, us-west-2")
+
+        assert first.regions is second.regions
+        assert first.regions[0] is sys.intern("us-east-1")
+
+    def test_split_csv_strips_surrounding_whitespace(self):
+        """Test the splitter strips newlines, form feeds and Unicode spaces around entries."""
+        text = "us-east-1 ,\n us-west-2,\r\n\v,\u00a0eu-west-1\f"
+
+        assert _split_csv(text) == ("us-east-1", "us-west-2", "eu-west-1")
+
+    def test_load_from_cli_rejects_internal_whitespace(self):
+        """Test that whitespace inside a region name is not silently removed."""
+        with pytest.raises(ValueError, match="Invalid region format"):
+            load_from_cli(account="123456789012", regions="us-east -1")
+
     def test_load_from_cli_with_optional_fields(self):
         """Test loading with optional cross-account fields."""
         config = load_from_cli(
@@ -60,30 +97,35 @@ class TestLoadFromCLI:
             )
 
 
+@pytest.fixture
+def write_yaml(tmp_path):
+    """Provide a factory that writes a YAML config file and returns its path."""
+
+    def _write(data, name="config.yml"):
+        path = tmp_path / name
+        path.write_text(yaml.dump(data, Dumper=_DUMPER))
+        return str(path)
+
+    return _write
+
+
 class TestLoadFromYAML:
     """Tests for load_from_yaml()."""
 
-    def test_load_from_yaml_basic(self):
+    def test_load_from_yaml_basic(self, write_yaml):
         """Test loading config from YAML file."""
         config_data = {
             "source_account": "123456789012",
             "regions": ["us-east-1", "us-west-2"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
-
-        try:
-            config = load_from_yaml(temp_path)
+        config = load_from_yaml(write_yaml(config_data))
 
-            assert isinstance(config, RegionConfig)
-            assert config.source_account == "123456789012"
-            assert config.regions == ("us-east-1", "us-west-2")
-        finally:
-            Path(temp_path).unlink()
+        assert isinstance(config, RegionConfig)
+        assert config.source_account == "123456789012"
+        assert config.regions == ("us-east-1", "us-west-2")
 
-    def test_load_from_yaml_with_optional_fields(self):
+    def test_load_from_yaml_with_optional_fields(self, write_yaml):
         """Test loading YAML with optional fields."""
         config_data = {
             "source_account": "123456789012",
@@ -91,66 +133,172 @@ class TestLoadFromYAML:
             "assume_role_arn": "arn:aws:iam::123456789012:role/BackupReader",
             "external_id": "ext-123",
             "session_name": "custom-session",
+            "max_workers": 5,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
+        config = load_from_yaml(write_yaml(config_data))
 
-        try:
-            config = load_from_yaml(temp_path)
-
-            assert config.assume_role_arn == "arn:aws:iam::123456789012:role/BackupReader"
-            assert config.external_id == "ext-123"
-            assert config.session_name == "custom-session"
-        finally:
-            Path(temp_path).unlink()
+        assert config.assume_role_arn == "arn:aws:iam::123456789012:role/BackupReader"
+        assert config.external_id == "ext-123"
+        assert config.session_name == "custom-session"
+        assert config.max_workers == 5
 
     def test_load_from_yaml_file_not_found(self):
         """Test error when YAML file doesn't exist."""
         with pytest.raises(FileNotFoundError, match="not found"):
             load_from_yaml("/nonexistent/config.yml")
 
-    def test_load_from_yaml_missing_source_account(self):
+    def test_load_from_yaml_missing_source_account(self, write_yaml):
         """Test error when source_account is missing."""
         config_data = {
             "regions": ["us-east-1"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="source_account"):
-                load_from_yaml(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(ValueError, match="source_account"):
+            load_from_yaml(write_yaml(config_data))
 
-    def test_load_from_yaml_missing_regions(self):
+    def test_load_from_yaml_missing_regions(self, write_yaml):
         """Test error when regions are missing."""
         config_data = {
             "source_account": "123456789012",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
+        with pytest.raises(ValueError, match="regions"):
+            load_from_yaml(write_yaml(config_data))
 
-        try:
-            with pytest.raises(ValueError, match="regions"):
-                load_from_yaml(temp_path)
-        finally:
-            Path(temp_path).unlink()
+    @pytest.mark.parametrize("max_workers", [None, 2.9, True, "5"])
+    def test_load_from_yaml_rejects_non_integer_max_workers(self, write_yaml, max_workers):
+        """Test that max_workers must be a plain integer, not null, a float or a bool."""
+        config_data = {
+            "source_account": "123456789012",
+            "regions": ["us-east-1"],
+            "max_workers": max_workers,
+        }
+
+        with pytest.raises(ValueError, match="max_workers must be an integer"):
+            load_from_yaml(write_yaml(config_data))
 
-    def test_load_from_yaml_invalid_format(self):
+    def test_load_from_yaml_rejects_non_string_region(self, write_yaml):
+        """Test that a mapping in the region list is reported as a bad region."""
+        config_data = {
+            "source_account": "123456789012",
+            "regions": [{"name": "us-east-1"}],
+        }
+
+        with pytest.raises(ValueError, match="Invalid region format"):
+            load_from_yaml(write_yaml(config_data))
+
+    def test_load_from_yaml_invalid_format(self, write_yaml):
         """Test error when YAML is not a dictionary."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write("- just\n- a\n- list\n")
-            temp_path = f.name
+        with pytest.raises(ValueError, match="YAML dictionary"):
+            load_from_yaml(write_yaml(["just", "a", "list"]))
+
+    def test_load_from_yaml_reuses_unchanged_file(self, write_yaml):
+        """Test repeated loads of an unchanged file return the cached config."""
+        config_data = {
+            "source_account": "123456789012",
+            "regions": ["us-east-1"],
+        }
+        config_path = write_yaml(config_data)
+
+        assert load_from_yaml(config_path) is load_from_yaml(config_path)
+
+    def test_load_from_yaml_reloads_changed_file(self, write_yaml):
+        """Test that editing the file invalidates the cached config."""
+        config_path = write_yaml({"source_account": "123456789012", "regions": ["us-east-1"]})
+        first = load_from_yaml(config_path)
+
+        write_yaml({"source_account": "123456789012", "regions": ["us-east-1", "us-west-2"]})
+        second = load_from_yaml(config_path)
+
+        assert first.regions == ("us-east-1",)
+        assert second.regions == ("us-east-1", "us-west-2")
+
+    def test_load_from_yaml_cache_can_be_disabled(self, write_yaml, monkeypatch):
+        """Test AWS_VAULT_SHUFFLE_YAML_CACHE=0 re-parses every load."""
+        monkeypatch.setenv("AWS_VAULT_SHUFFLE_YAML_CACHE", "0")
+        config_path = write_yaml({"source_account": "123456789012", "regions": ["us-east-1"]})
+
+        first = load_from_yaml(config_path)
+        second = load_from_yaml(config_path)
+
+        assert first == second
+        assert first is not second
+
+    def test_load_from_yaml_writes_json_copy(self, write_yaml, isolated_cache_dir):
+        """Test a fresh process can rebuild the config from the JSON copy."""
+        config_path = write_yaml({"source_account": "123456789012", "regions": ["us-east-1"]})
+
+        config = load_from_yaml(config_path)
+        cached = list((isolated_cache_dir / "config").glob("*.json"))
+        assert len(cached) == 1
+
+        # Simulate a new process: drop the in-memory cache and break the YAML
+        # parser so only the JSON copy can satisfy the load
+        _load_yaml_cached.cache_clear()
+        with patch("yaml.load", side_effect=AssertionError("YAML parsed")):
+            assert load_from_yaml(config_path) == config
+
+    def test_load_from_yaml_ignores_stale_json_copy(self, write_yaml):
+        """Test that an edited file is re-parsed instead of using its old copy."""
+        config_path = write_yaml({"source_account": "123456789012", "regions": ["us-east-1"]})
+        load_from_yaml(config_path)
+
+        _load_yaml_cached.cache_clear()
+        write_yaml({"source_account": "123456789012", "regions": ["us-east-1", "us-west-2"]})
+
+        assert load_from_yaml(config_path).regions == ("us-east-1", "us-west-2")
+
+    def test_load_from_yaml_reloads_same_size_edit_with_restored_mtime(self, write_yaml):
+        """Test that a same-size edit is seen even when its mtime is put back."""
+        config_path = write_yaml({"source_account": "111111111111", "regions": ["us-east-1"]})
+        original = os.stat(config_path)
+        assert load_from_yaml(config_path).source_account == "111111111111"
+
+        # As after tar, rsync -t or cp -p: same size, same mtime, new content
+        write_yaml({"source_account": "222222222222", "regions": ["us-east-1"]})
+        os.utime(config_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+        assert os.stat(config_path).st_size == original.st_size
+
+        assert load_from_yaml(config_path).source_account == "222222222222"
+        _load_yaml_cached.cache_clear()
+        assert load_from_yaml(config_path).source_account == "222222222222"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+    def test_load_from_yaml_reads_fifo(self, tmp_path, isolated_cache_dir):
+        """Test that a FIFO (as from --config <(...)) loads and bypasses both caches."""
+        fifo = tmp_path / "config.fifo"
+        os.mkfifo(fifo)
+        _load_yaml_cached.cache_clear()
+        text = yaml.dump({"source_account": "123456789012", "regions": ["eu-west-1"]})
+
+        def _feed():
+            with open(fifo, "w") as f:
+                f.write(text)
+
+        for _ in range(2):
+            writer = threading.Thread(target=_feed)
+            writer.start()
+            config = load_from_yaml(str(fifo))
+            writer.join(timeout=5)
+            assert config.regions == ("eu-west-1",)
+
+        assert _load_yaml_cached.cache_info().currsize == 0
+        assert not (isolated_cache_dir / "config").exists()
+
+    def test_yaml_loader_prefers_libyaml(self):
+        """Test that the C loader is used when PyYAML was built with libyaml."""
+        expected = yaml.CSafeLoader if hasattr(yaml, "CSafeLoader") else yaml.SafeLoader
+        assert _yaml_loader() is expected
 
+    @pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+    def test_read_small_file_reads_pipe_to_eof(self):
+        """Test that a pipe, whose fstat() size is 0, is read completely."""
+        payload = b"regions:\n" + b"  - us-east-1\n" * 1000
+        read_fd, write_fd = os.pipe()
         try:
-            with pytest.raises(ValueError, match="YAML dictionary"):
-                load_from_yaml(temp_path)
+            os.write(write_fd, payload)
+            os.close(write_fd)
+            assert _read_small_file(f"/dev/fd/{read_fd}") == payload
         finally:
-            Path(temp_path).unlink()
+            os.close(read_fd)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Unit tests for the AWS Backup response cache."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
+from aws_vault_shuffle.infrastructure.response_cache import CachedBackupClient
+
+
+class CountingBackupClient:
+    """Fake backup client that counts delegated calls."""
+
+    def __init__(self):
+        """Initialize fake client with call counters."""
+        self.calls = 0
+
+    def list_vaults(self, region: str) -> list[Vault]:
+        """Return a single fake vault."""
+        self.calls += 1
+        return [
+            Vault(
+                name="vault-1",
+                arn=f"arn:aws:backup:{region}:123456789012:backup-vault:vault-1",
+                region=region,
+            )
+        ]
+
+    def list_recovery_points(self, vault_name: str, region: str) -> tuple[RecoveryPoint, ...]:
+        """Return one fake recovery point."""
+        self.calls += 1
+        return (
+            RecoveryPoint(
+                arn=f"arn:aws:backup:{region}:123456789012:recovery-point:rp1",
+                vault_name=vault_name,
+                resource_arn=f"arn:aws:ec2:{region}:123456789012:volume/vol-1",
+                resource_type="EBS",
+                creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+                status="COMPLETED",
+                backup_size_bytes=1024,
+            ),
+        )
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        """Start the clock at a fixed epoch."""
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def inner():
+    """Provide a counting fake client."""
+    return CountingBackupClient()
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+class TestCachedBackupClient:
+    """Tests for CachedBackupClient."""
+
+    def test_cache_hit_within_ttl(self, inner, clock, tmp_path):
+        """Test that a fresh entry is served without calling AWS."""
+        client = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+
+        first = client.list_vaults("us-east-1")
+        clock.now += 30
+        second = client.list_vaults("us-east-1")
+
+        assert inner.calls == 1
+        assert second == first
+
+    def test_cache_miss_after_ttl(self, inner, clock, tmp_path):
+        """Test that an expired entry is refetched."""
+        client = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+
+        client.list_vaults("us-east-1")
+        clock.now += 61
+        client.list_vaults("us-east-1")
+
+        assert inner.calls == 2
+
+    def test_cache_round_trips_recovery_points(self, inner, clock, tmp_path):
+        """Test that recovery points and datetimes survive the cache."""
+        client = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+
+        fetched = client.list_recovery_points("vault-1", "us-east-1")
+        cached = client.list_recovery_points("vault-1", "us-east-1")
+
+        assert inner.calls == 1
+        assert cached == fetched
+        assert cached[0].creation_date.tzinfo is not None
+
+    def test_cache_keyed_by_account_and_vault(self, inner, clock, tmp_path):
+        """Test that different accounts and vaults do not share entries."""
+        client_a = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+        client_b = CachedBackupClient(inner, "210987654321", 60, tmp_path, clock)
+
+        client_a.list_recovery_points("vault-1", "us-east-1")
+        client_a.list_recovery_points("vault-2", "us-east-1")
+        client_b.list_recovery_points("vault-1", "us-east-1")
+
+        assert inner.calls == 3
+
+    def test_corrupt_entry_is_refetched(self, inner, clock, tmp_path):
+        """Test that an unreadable cache file is treated as a miss."""
+        client = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+        client.list_vaults("us-east-1")
+
+        for path in tmp_path.rglob("*.json"):
+            path.write_text("not json")
+
+        vaults = client.list_vaults("us-east-1")
+
+        assert inner.calls == 2
+        assert vaults[0].name == "vault-1"
+
+    def test_entry_with_stale_schema_is_refetched(self, inner, clock, tmp_path):
+        """Test that valid JSON which no longer rehydrates is treated as a miss."""
+        client = CachedBackupClient(inner, "123456789012", 60, tmp_path, clock)
+        client.list_recovery_points("vault-1", "us-east-1")
+
+        for path in tmp_path.rglob("*.json"):
+            entry = json.loads(path.read_text())
+            del entry["payload"][0]["resource_type"]
+            path.write_text(json.dumps(entry))
+
+        recovery_points = client.list_recovery_points("vault-1", "us-east-1")
+
+        assert inner.calls == 2
+        assert recovery_points[0].resource_type == "EBS"
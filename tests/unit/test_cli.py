@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 """Unit tests for CLI module."""
 
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
 
 from aws_vault_shuffle import __version__
-from aws_vault_shuffle.cli import create_parser, main
+from aws_vault_shuffle.cli import (
+    _fast_parse_list,
+    _format_bytes,
+    _print_json_output,
+    _print_summary_output,
+    _print_table_output,
+    create_parser,
+    main,
+)
+from aws_vault_shuffle.domain.vault import RecoveryPoint, Vault
 
 
 class TestCLIVersion:
@@ -21,6 +36,44 @@ class TestCLIVersion:
         captured = capsys.readouterr()
         assert __version__ in captured.out
 
+    def test_main_version_fast_path(self, capsys):
+        """Test main() answers --version without argparse."""
+        exit_code = main(["--version"])
+
+        assert exit_code == 0
+        captured = capsys.readouterr()
+        assert captured.out == f"aws-vault-shuffle {__version__}\n"
+
+
+class TestCLIImports:
+    """Tests for CLI import cost."""
+
+    def test_cli_import_skips_aws_sdk(self):
+        """Test importing the CLI does not load boto3 or PyYAML."""
+        code = (
+            "import sys, aws_vault_shuffle.cli; "
+            "print(sorted(m for m in ('boto3', 'botocore', 'yaml') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_infrastructure_import_skips_aws_sdk(self):
+        """Test importing the adapter and loader defers boto3 and PyYAML."""
+        code = (
+            "import sys; "
+            "import aws_vault_shuffle.infrastructure.aws_backup_adapter; "
+            "import aws_vault_shuffle.infrastructure.config_loader; "
+            "print(sorted(m for m in ('boto3', 'botocore', 'yaml') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
 
 class TestCLIListCommand:
     """Tests for 'list' command."""
@@ -39,6 +92,10 @@ class TestCLIListCommand:
         assert args.regions == "us-east-1,us-west-2"
         assert args.output == "table"  # default
 
+    def test_parser_is_built_once(self):
+        """Test create_parser returns one shared parser."""
+        assert create_parser() is create_parser()
+
     def test_list_with_config_file(self):
         """Test list command with config file."""
         parser = create_parser()
@@ -62,6 +119,18 @@ class TestCLIListCommand:
 
         assert args.output == "json"
 
+    def test_list_with_max_workers(self):
+        """Test list command with custom concurrency limit."""
+        parser = create_parser()
+        args = parser.parse_args([
+            "list",
+            "--account", "123456789012",
+            "--regions", "us-east-1",
+            "--max-workers", "4",
+        ])
+
+        assert args.max_workers == 4
+
     def test_dry_run_flag(self):
         """Test --dry-run flag is parsed (must come before subcommand)."""
         parser = create_parser()
@@ -75,6 +144,43 @@ class TestCLIListCommand:
         assert args.dry_run is True
 
 
+class TestCLIFastParse:
+    """Tests for the argparse-free `list` fast path."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["list"],
+            ["list", "--account", "123456789012", "--regions", "us-east-1,us-west-2"],
+            ["list", "--config", "config.yml", "--output", "summary"],
+            ["list", "--config", "c.yml", "--max-workers", "5", "--cache-ttl", "300"],
+            ["list", "--account", "123456789012", "--regions", "us-east-1", "--max-tps", "2.5"],
+            ["list", "--output", "json", "--output", "table"],
+        ],
+    )
+    def test_matches_argparse(self, argv):
+        """Test the fast path yields the same namespace as argparse."""
+        assert _fast_parse_list(argv) == create_parser().parse_args(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--version"],
+            ["list", "--help"],
+            ["list", "--account"],
+            ["list", "--acc", "123456789012"],
+            ["list", "--account=123456789012"],
+            ["list", "--output", "xml"],
+            ["list", "--max-workers", "many"],
+            ["--dry-run", "list"],
+        ],
+    )
+    def test_falls_back_to_argparse(self, argv):
+        """Test anything unusual is left for argparse to parse or reject."""
+        assert _fast_parse_list(argv) is None
+
+
 class TestCLIMain:
     """Tests for main() function."""
 
@@ -117,3 +223,172 @@ class TestCLIMain:
         assert "123456789012" in captured.out
         assert "us-east-1" in captured.out
         assert "us-west-2" in captured.out
+
+    @pytest.mark.parametrize(
+        ("extra_args", "expected_workers"),
+        [
+            ([], 7),
+            (["--max-workers", "3"], 3),
+        ],
+    )
+    def test_main_list_max_workers_overrides_config(self, tmp_path, extra_args, expected_workers):
+        """Test --max-workers takes precedence over max_workers in the config file."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(
+            'source_account: "123456789012"\nregions:\n  - us-east-1\nmax_workers: 7\n'
+        )
+
+        with patch(
+            "aws_vault_shuffle.application.inventory_service.InventoryService.iter_all_vaults",
+            return_value=iter(()),
+        ) as iter_all_vaults:
+            exit_code = main(["list", "--config", str(config_file), *extra_args])
+
+        assert exit_code == 0
+        assert iter_all_vaults.call_args.args[0].max_workers == expected_workers
+
+
+def _sample_vaults():
+    """Build a small vault list for output formatting tests."""
+    rp = RecoveryPoint(
+        arn="arn:aws:backup:us-east-1:123456789012:recovery-point:rp1",
+        vault_name="vault-1",
+        resource_arn="arn:aws:ec2:us-east-1:123456789012:volume/vol-1",
+        resource_type="EBS",
+        creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        status="COMPLETED",
+        backup_size_bytes=2048,
+    )
+    return [
+        Vault(
+            name="vault-1",
+            arn="arn:aws:backup:us-east-1:123456789012:backup-vault:vault-1",
+            region="us-east-1",
+            recovery_points=(rp,),
+        ),
+        Vault(
+            name="vault-2",
+            arn="arn:aws:backup:us-west-2:123456789012:backup-vault:vault-2",
+            region="us-west-2",
+        ),
+    ]
+
+
+class TestCLIOutput:
+    """Tests for output formatting of streamed vaults."""
+
+    def test_json_output_is_valid_array(self, capsys):
+        """Test streamed JSON output parses as one array."""
+        _print_json_output(iter(_sample_vaults()))
+
+        data = json.loads(capsys.readouterr().out)
+        assert [v["name"] for v in data] == ["vault-1", "vault-2"]
+        assert data[0]["recovery_points"][0]["creation_date"] == "2025-01-01T12:00:00+00:00"
+
+    def test_json_output_matches_without_orjson(self, capsys, monkeypatch):
+        """Test the optional orjson encoder produces the stdlib output."""
+        pytest.importorskip("orjson")
+
+        _print_json_output(iter(_sample_vaults()))
+        with_orjson = capsys.readouterr().out
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        _print_json_output(iter(_sample_vaults()))
+        without_orjson = capsys.readouterr().out
+
+        assert with_orjson == without_orjson
+
+    def test_json_output_matches_without_orjson_for_unusual_values(self, capsys, monkeypatch):
+        """Test both encoders agree on non-ASCII names and integers wider than 64 bits."""
+        pytest.importorskip("orjson")
+        rp = RecoveryPoint(
+            arn="arn:aws:backup:eu-west-1:123456789012:recovery-point:rp-ü",
+            vault_name="vaultü",
+            resource_arn="arn:aws:ec2:eu-west-1:123456789012:volume/vol-1",
+            resource_type="EBS",
+            creation_date=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            status="COMPLETED",
+            backup_size_bytes=2**70,
+        )
+        vaults = [
+            Vault(
+                name="vaultü",
+                arn="arn:aws:backup:eu-west-1:123456789012:backup-vault:vaultü",
+                region="eu-west-1",
+                recovery_points=(rp,),
+            ),
+        ]
+
+        _print_json_output(iter(vaults))
+        with_orjson = capsys.readouterr().out
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        _print_json_output(iter(vaults))
+        without_orjson = capsys.readouterr().out
+
+        assert with_orjson == without_orjson
+        assert '"name": "vaultü"' in with_orjson
+        assert json.loads(with_orjson)[0]["total_size_bytes"] == 2**70
+
+    def test_json_output_empty(self, capsys):
+        """Test streamed JSON output for no vaults."""
+        _print_json_output(iter([]))
+
+        assert capsys.readouterr().out == "[]\n"
+
+    def test_table_output_totals(self, capsys):
+        """Test table output reports totals after streaming vaults."""
+        _print_table_output(iter(_sample_vaults()))
+
+        out = capsys.readouterr().out
+        assert out.startswith(
+            "Vault: vault-1 (us-east-1)\n"
+            "  ARN: arn:aws:backup:us-east-1:123456789012:backup-vault:vault-1\n"
+            "  Recovery Points: 1\n"
+            "  Recovery Points:\n"
+            "    - EBS: arn:aws:ec2:us-east-1:123456789012:volume/vol-1\n"
+            "      Status: COMPLETED, Size: 2.00 KB, Created: 2025-01-01 12:00:00+00:00\n"
+            "\n"
+            "Vault: vault-2 (us-west-2)\n"
+        )
+        assert "Found 2 vault(s) with 1 recovery point(s)" in out
+        assert "Total backup size: 2.00 KB" in out
+
+    def test_summary_output(self, capsys):
+        """Test summary output aggregates by region and resource type."""
+        _print_summary_output(iter(_sample_vaults()))
+
+        out = capsys.readouterr().out
+        assert "Total Vaults: 2" in out
+        assert "us-east-1: 1 vault(s), 1 recovery point(s), 2.00 KB" in out
+        assert "us-west-2: 1 vault(s), 0 recovery point(s), 0.00 B" in out
+        assert "EBS: 1" in out
+
+    def test_empty_output_message(self, capsys):
+        """Test table and summary output report no vaults."""
+        _print_table_output(iter([]))
+        _print_summary_output(iter([]))
+
+        assert capsys.readouterr().out.count("No backup vaults found.") == 2
+
+
+class TestFormatBytes:
+    """Tests for _format_bytes()."""
+
+    @pytest.mark.parametrize(
+        ("num_bytes", "expected"),
+        [
+            (None, "unknown"),
+            (0, "0.00 B"),
+            (1023, "1023.00 B"),
+            (1024, "1.00 KB"),
+            (1536, "1.50 KB"),
+            (1024**2 - 1, "1024.00 KB"),
+            (1024**3, "1.00 GB"),
+            (1024**5, "1.00 PB"),
+            (1024**6, "1024.00 PB"),
+        ],
+    )
+    def test_format_bytes(self, num_bytes, expected):
+        """Test unit selection and formatting."""
+        assert _format_bytes(num_bytes) == expected